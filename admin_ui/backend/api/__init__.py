@@ -1 +1,23 @@
-from . import mcp  # noqa: F401
+"""Admin UI API routers.
+
+Submodules are imported on first attribute access (PEP 562) so importing the
+package does not pull in docker, httpx, yaml, ... until a router is needed.
+"""
+
+import importlib
+
+_LAZY = frozenset(
+    {"config", "system", "wizard", "logs", "local_ai", "ollama", "mcp", "calls", "outbound", "tools", "docs"}
+)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        mod = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
@@ -5,18 +5,20 @@ from yaml.nodes import MappingNode, SequenceNode, ScalarNode
 import os
 import re
 import asyncio
-import glob
+import copy
 import tempfile
 import sys
 import logging
+import threading
 import ssl
 import smtplib
 from email.message import EmailMessage
 from contextlib import contextmanager
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 from urllib.parse import urlparse
 import settings
+from services.fs import atomic_write_bytes, atomic_write_lines, snapshot_file
 
 # A11: Maximum number of backups to keep
 MAX_BACKUPS = 5
@@ -24,6 +26,14 @@ MAX_BACKUPS = 5
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed safe loader/dumper when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# path -> ((st_ino, st_mtime_ns, st_size), parsed document)
+_yaml_file_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+_yaml_file_cache_lock = threading.Lock()
+
 def _is_prefix(key: str, prefixes: tuple[str, ...]) -> bool:
     return any(key.startswith(p) for p in prefixes)
 
@@ -59,8 +69,8 @@ def _upsert_env_key(key: str, value: str) -> None:
             lines.append("\n")
         lines.append(f"{key}={value}\n")
 
-    with open(env_path, "w") as f:
-        f.writelines(lines)
+    # Replace rather than rewrite in place so hardlinked .env backups stay intact.
+    atomic_write_lines(env_path, lines)
 
 
 def _ai_engine_env_key(key: str) -> bool:
@@ -137,10 +147,35 @@ def _assert_no_duplicate_yaml_keys(node: yaml.Node) -> None:
 
 
 def _safe_load_no_duplicates(content: str):
-    node = yaml.compose(content, Loader=yaml.SafeLoader)
-    if node is not None:
+    # Compose once and construct from the same node tree rather than parsing twice.
+    loader = _YAML_LOADER(content)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None
         _assert_no_duplicate_yaml_keys(node)
-    return yaml.safe_load(content)
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def _load_yaml_file_cached(path: str) -> Any:
+    """
+    Parse *path* (rejecting duplicate keys), reusing the previous parse while the
+    file's inode, mtime and size are unchanged.
+
+    Returns a deep copy so callers may mutate the result freely.
+    """
+    st = os.stat(path)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    with _yaml_file_cache_lock:
+        cached = _yaml_file_cache.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "r") as f:
+            cached = (stamp, _safe_load_no_duplicates(f.read()))
+        with _yaml_file_cache_lock:
+            _yaml_file_cache[path] = cached
+    return copy.deepcopy(cached[1])
 
 
 def _deep_merge_dicts(base: dict, override: dict) -> dict:
@@ -170,8 +205,7 @@ def _read_base_config_dict() -> dict:
     """Read base config/ai-agent.yaml as a dict (no local overrides)."""
     if not os.path.exists(settings.CONFIG_PATH):
         return {}
-    with open(settings.CONFIG_PATH, "r") as f:
-        base = _safe_load_no_duplicates(f.read()) or {}
+    base = _load_yaml_file_cached(settings.CONFIG_PATH) or {}
     return base if isinstance(base, dict) else {}
 
 
@@ -219,15 +253,13 @@ def _read_merged_config_dict() -> dict:
     """
     if not os.path.exists(settings.CONFIG_PATH):
         return {}
-    with open(settings.CONFIG_PATH, "r") as f:
-        base = _safe_load_no_duplicates(f.read()) or {}
+    base = _load_yaml_file_cached(settings.CONFIG_PATH) or {}
 
     if not os.path.exists(settings.LOCAL_CONFIG_PATH):
         return base
 
     try:
-        with open(settings.LOCAL_CONFIG_PATH, "r") as f:
-            local = _safe_load_no_duplicates(f.read()) or {}
+        local = _load_yaml_file_cached(settings.LOCAL_CONFIG_PATH) or {}
     except Exception:
         return base
 
@@ -240,7 +272,7 @@ def _read_merged_config_dict() -> dict:
 def _read_merged_config_content() -> str:
     """Return the merged config as a YAML string (for display / validation)."""
     merged = _read_merged_config_dict()
-    return yaml.dump(merged, default_flow_style=False, sort_keys=False) if merged else ""
+    return yaml.dump(merged, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False) if merged else ""
 
 
 def _write_local_config(content: str) -> None:
@@ -255,13 +287,13 @@ def _write_local_config(content: str) -> None:
     if dir_path:
         os.makedirs(dir_path, exist_ok=True)
 
-    # Backup existing local file
-    if os.path.exists(settings.LOCAL_CONFIG_PATH):
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = f"{settings.LOCAL_CONFIG_PATH}.bak.{timestamp}"
-        with open(settings.LOCAL_CONFIG_PATH, "r") as src:
-            with open(backup_path, "w") as dst:
-                dst.write(src.read())
+    # Backup existing local file (hardlink is safe: the file is replaced below, not rewritten)
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    try:
+        snapshot_file(settings.LOCAL_CONFIG_PATH, f"{settings.LOCAL_CONFIG_PATH}.bak.{timestamp}")
+    except FileNotFoundError:
+        pass
+    else:
         _rotate_backups(settings.LOCAL_CONFIG_PATH)
 
     # Preserve permissions from existing local or base file
@@ -325,11 +357,25 @@ def _rotate_backups(base_path: str) -> None:
     A11: Keep only the last MAX_BACKUPS backup files.
     Deletes oldest backups when limit is exceeded.
     """
-    pattern = f"{base_path}.bak.*"
-    backups = sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True)
+    # One scandir pass with a prefix match instead of glob + a separate getmtime per match.
+    dir_path = os.path.dirname(base_path) or "."
+    prefix = f"{os.path.basename(base_path)}.bak."
+    backups: list[tuple[float, str]] = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if not entry.name.startswith(prefix):
+                    continue
+                try:
+                    backups.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return
+    backups.sort(reverse=True)
     
     # Delete oldest backups beyond MAX_BACKUPS
-    for old_backup in backups[MAX_BACKUPS:]:
+    for _, old_backup in backups[MAX_BACKUPS:]:
         try:
             os.remove(old_backup)
         except OSError:
@@ -559,7 +605,7 @@ async def update_yaml_config(update: ConfigUpdate):
         # Convert desired merged config into a minimal local override (supports deletions).
         base = _read_base_config_dict()
         local_override = _compute_local_override(base, new_parsed)
-        local_content = yaml.dump(local_override or {}, default_flow_style=False, sort_keys=False)
+        local_content = yaml.dump(local_override or {}, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
         # Write to LOCAL override file (keeps base ai-agent.yaml clean for git)
         _write_local_config(local_content)
@@ -727,13 +773,15 @@ async def update_env(env_data: Dict[str, Optional[str]]):
                 raise HTTPException(status_code=400, detail=f"Key cannot contain '=': {key}")
         
         # Create backup before saving
-        if os.path.exists(settings.ENV_PATH):
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = f"{settings.ENV_PATH}.bak.{timestamp}"
-            with open(settings.ENV_PATH, 'r') as src:
-                with open(backup_path, 'w') as dst:
-                    dst.write(src.read())
+        import datetime
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_path = f"{settings.ENV_PATH}.bak.{timestamp}"
+        try:
+            # .env is replaced atomically below, so a hardlink is a safe snapshot.
+            snapshot_file(settings.ENV_PATH, backup_path)
+        except FileNotFoundError:
+            pass
+        else:
             # A11: Rotate backups
             _rotate_backups(settings.ENV_PATH)
 
@@ -1701,7 +1749,6 @@ async def import_configuration(file: UploadFile = File(...)):
     try:
         import zipfile
         import io
-        import shutil
         import datetime
         
         content = await file.read()
@@ -1713,13 +1760,11 @@ async def import_configuration(file: UploadFile = File(...)):
         # Create backups of current config
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        if os.path.exists(settings.LOCAL_CONFIG_PATH):
-            backup_path = f"{settings.LOCAL_CONFIG_PATH}.bak.{timestamp}"
-            shutil.copy2(settings.LOCAL_CONFIG_PATH, backup_path)
-            
-        if os.path.exists(settings.ENV_PATH):
-            backup_path = f"{settings.ENV_PATH}.bak.{timestamp}"
-            shutil.copy2(settings.ENV_PATH, backup_path)
+        for path in (settings.LOCAL_CONFIG_PATH, settings.ENV_PATH):
+            try:
+                snapshot_file(path, f"{path}.bak.{timestamp}")
+            except FileNotFoundError:
+                pass
         
         with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
             # Check contents
@@ -1728,17 +1773,15 @@ async def import_configuration(file: UploadFile = File(...)):
                 raise HTTPException(status_code=400, detail="ZIP must contain ai-agent.yaml, ai-agent.local.yaml, or .env")
             
             # Extract: imported ai-agent.yaml content goes to the LOCAL override
-            # so the git-tracked base stays clean.
+            # so the git-tracked base stays clean. Atomic replaces ensure a failed
+            # import never leaves a half-written config behind.
             if 'ai-agent.local.yaml' in file_names:
-                with open(settings.LOCAL_CONFIG_PATH, 'wb') as f:
-                    f.write(zip_ref.read('ai-agent.local.yaml'))
+                atomic_write_bytes(settings.LOCAL_CONFIG_PATH, zip_ref.read('ai-agent.local.yaml'))
             elif 'ai-agent.yaml' in file_names:
-                with open(settings.LOCAL_CONFIG_PATH, 'wb') as f:
-                    f.write(zip_ref.read('ai-agent.yaml'))
+                atomic_write_bytes(settings.LOCAL_CONFIG_PATH, zip_ref.read('ai-agent.yaml'))
                     
             if '.env' in file_names:
-                with open(settings.ENV_PATH, 'wb') as f:
-                    f.write(zip_ref.read('.env'))
+                atomic_write_bytes(settings.ENV_PATH, zip_ref.read('.env'))
                     
         return {"success": True, "message": "Configuration imported successfully."}
         
@@ -1781,13 +1824,13 @@ def update_yaml_provider_field(provider_name: str, field: str, value: Any) -> bo
 
         # Validate the fully-merged config, then persist only minimal local override
         # so base defaults can continue to evolve across releases.
-        merged_content = yaml.dump(merged_config, default_flow_style=False, sort_keys=False)
+        merged_content = yaml.dump(merged_config, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
         # Validate before writing
         _validate_ai_agent_config(merged_content)
 
         local_override = _compute_local_override(base_config, merged_config)
-        content = yaml.dump(local_override, default_flow_style=False, sort_keys=False)
+        content = yaml.dump(local_override, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
         # Write to LOCAL override file
         _write_local_config(content)
@@ -17,7 +17,12 @@ import asyncio
 import websockets
 import shutil
 import time
-from services.fs import upsert_env_vars
+import logging
+from collections import deque
+from types import MappingProxyType
+from services.fs import EnvUpdateResult, upsert_env_vars
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -86,8 +91,11 @@ def _disk_build_preflight(path: str) -> tuple[bool, Optional[str]]:
     return True, None
 
 
+_TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
 def _truthy(raw: Optional[str]) -> bool:
-    return str(raw or "").strip().lower() in {"1", "true", "yes", "on"}
+    return str(raw or "").strip().lower() in _TRUTHY_VALUES
 
 
 def _map_cuda_runtime_issue(raw_reason: Optional[str]) -> str:
@@ -465,6 +473,25 @@ async def list_available_models():
     )
 
 
+async def _request_server_capabilities() -> Dict[str, Any]:
+    """Send a `capabilities` request to local-ai-server and return the raw response."""
+    from settings import get_setting
+
+    ws_url = get_setting("HEALTH_CHECK_LOCAL_AI_URL", "ws://127.0.0.1:8765")
+    async with websockets.connect(ws_url, open_timeout=5) as ws:
+        auth_token = (get_setting("LOCAL_WS_AUTH_TOKEN", os.getenv("LOCAL_WS_AUTH_TOKEN", "")) or "").strip()
+        if auth_token:
+            await ws.send(json.dumps({"type": "auth", "auth_token": auth_token}))
+            raw = await asyncio.wait_for(ws.recv(), timeout=5)
+            data = json.loads(raw)
+            if data.get("type") != "auth_response" or data.get("status") != "ok":
+                raise RuntimeError(f"Local AI auth failed: {data}")
+
+        await ws.send(json.dumps({"type": "capabilities"}))
+        response = await asyncio.wait_for(ws.recv(), timeout=5)
+        return json.loads(response)
+
+
 @router.get("/capabilities")
 async def get_backend_capabilities():
     """
@@ -479,7 +506,6 @@ async def get_backend_capabilities():
     - Kokoro: Check if kokoro models exist
     - LLM: Check if llama-cpp-python is installed
     """
-    from settings import get_setting
     import subprocess
     
     capabilities = {
@@ -499,60 +525,46 @@ async def get_backend_capabilities():
     }
     
     # Query local-ai-server for its capabilities
-    ws_url = get_setting("HEALTH_CHECK_LOCAL_AI_URL", "ws://127.0.0.1:8765")
-    
     try:
-        async with websockets.connect(ws_url, open_timeout=5) as ws:
-            auth_token = (get_setting("LOCAL_WS_AUTH_TOKEN", os.getenv("LOCAL_WS_AUTH_TOKEN", "")) or "").strip()
-            if auth_token:
-                await ws.send(json.dumps({"type": "auth", "auth_token": auth_token}))
-                raw = await asyncio.wait_for(ws.recv(), timeout=5)
-                data = json.loads(raw)
-                if data.get("type") != "auth_response" or data.get("status") != "ok":
-                    raise RuntimeError(f"Local AI auth failed: {data}")
-
-            # Request capabilities from local-ai-server
-            await ws.send(json.dumps({"type": "capabilities"}))
-            response = await asyncio.wait_for(ws.recv(), timeout=5)
-            data = json.loads(response)
+        data = await _request_server_capabilities()
+        
+        if data.get("type") == "capabilities_response":
+            # Merge capabilities from server
+            server_caps = data.get("capabilities", {})
             
-            if data.get("type") == "capabilities_response":
-                # Merge capabilities from server
-                server_caps = data.get("capabilities", {})
-                
-                # STT backends
-                if server_caps.get("vosk"):
-                    capabilities["stt"]["vosk"] = {"available": True, "reason": "Vosk installed"}
-                if server_caps.get("sherpa"):
-                    capabilities["stt"]["sherpa"] = {"available": True, "reason": "Sherpa-ONNX installed"}
-                if server_caps.get("kroko_embedded"):
-                    capabilities["stt"]["kroko_embedded"] = {"available": True, "reason": "Kroko binary installed"}
-                else:
-                    capabilities["stt"]["kroko_embedded"]["reason"] = "Rebuild with INCLUDE_KROKO_EMBEDDED=true"
-                if server_caps.get("faster_whisper"):
-                    capabilities["stt"]["faster_whisper"] = {"available": True, "reason": "Faster-Whisper installed"}
-                else:
-                    capabilities["stt"]["faster_whisper"]["reason"] = "Rebuild with INCLUDE_FASTER_WHISPER=true"
-
-                # TTS backends
-                if server_caps.get("piper"):
-                    capabilities["tts"]["piper"] = {"available": True, "reason": "Piper TTS installed"}
-                if server_caps.get("kokoro"):
-                    capabilities["tts"]["kokoro"] = {"available": True, "reason": "Kokoro installed"}
-                if server_caps.get("melotts"):
-                    capabilities["tts"]["melotts"] = {"available": True, "reason": "MeloTTS installed"}
-                else:
-                    capabilities["tts"]["melotts"]["reason"] = "Rebuild with INCLUDE_MELOTTS=true"
-                
-                # LLM
-                if server_caps.get("llama"):
-                    capabilities["llm"] = {"available": True, "reason": "llama-cpp-python installed"}
+            # STT backends
+            if server_caps.get("vosk"):
+                capabilities["stt"]["vosk"] = {"available": True, "reason": "Vosk installed"}
+            if server_caps.get("sherpa"):
+                capabilities["stt"]["sherpa"] = {"available": True, "reason": "Sherpa-ONNX installed"}
+            if server_caps.get("kroko_embedded"):
+                capabilities["stt"]["kroko_embedded"] = {"available": True, "reason": "Kroko binary installed"}
             else:
-                # Fallback: assume basic capabilities based on what we can detect
-                capabilities["stt"]["vosk"] = {"available": True, "reason": "Default backend"}
-                capabilities["tts"]["piper"] = {"available": True, "reason": "Default backend"}
-                capabilities["llm"] = {"available": True, "reason": "Default backend"}
-                
+                capabilities["stt"]["kroko_embedded"]["reason"] = "Rebuild with INCLUDE_KROKO_EMBEDDED=true"
+            if server_caps.get("faster_whisper"):
+                capabilities["stt"]["faster_whisper"] = {"available": True, "reason": "Faster-Whisper installed"}
+            else:
+                capabilities["stt"]["faster_whisper"]["reason"] = "Rebuild with INCLUDE_FASTER_WHISPER=true"
+
+            # TTS backends
+            if server_caps.get("piper"):
+                capabilities["tts"]["piper"] = {"available": True, "reason": "Piper TTS installed"}
+            if server_caps.get("kokoro"):
+                capabilities["tts"]["kokoro"] = {"available": True, "reason": "Kokoro installed"}
+            if server_caps.get("melotts"):
+                capabilities["tts"]["melotts"] = {"available": True, "reason": "MeloTTS installed"}
+            else:
+                capabilities["tts"]["melotts"]["reason"] = "Rebuild with INCLUDE_MELOTTS=true"
+            
+            # LLM
+            if server_caps.get("llama"):
+                capabilities["llm"] = {"available": True, "reason": "llama-cpp-python installed"}
+        else:
+            # Fallback: assume basic capabilities based on what we can detect
+            capabilities["stt"]["vosk"] = {"available": True, "reason": "Default backend"}
+            capabilities["tts"]["piper"] = {"available": True, "reason": "Default backend"}
+            capabilities["llm"] = {"available": True, "reason": "Default backend"}
+            
     except Exception as e:
         # Server not reachable - return minimal capabilities
         capabilities["stt"]["vosk"] = {"available": True, "reason": "Default backend"}
@@ -637,9 +649,10 @@ async def switch_model(request: SwitchModelRequest):
         except Exception:
             return None
 
-    async def _fetch_status() -> Optional[Dict[str, Any]]:
+    async def _open_status_ws():
         ws_url = get_setting("HEALTH_CHECK_LOCAL_AI_URL", "ws://127.0.0.1:8765")
-        async with websockets.connect(ws_url, open_timeout=5) as ws:
+        ws = await websockets.connect(ws_url, open_timeout=5)
+        try:
             auth_token = (get_setting("LOCAL_WS_AUTH_TOKEN", os.getenv("LOCAL_WS_AUTH_TOKEN", "")) or "").strip()
             if auth_token:
                 await ws.send(json.dumps({"type": "auth", "auth_token": auth_token}))
@@ -647,13 +660,25 @@ async def switch_model(request: SwitchModelRequest):
                 auth_data = json.loads(raw)
                 if auth_data.get("type") != "auth_response" or auth_data.get("status") != "ok":
                     raise RuntimeError(f"Local AI auth failed: {auth_data}")
+        except BaseException:
+            await ws.close()
+            raise
+        return ws
+
+    async def _request_status(ws) -> Optional[Dict[str, Any]]:
+        await ws.send(json.dumps({"type": "status"}))
+        raw = await asyncio.wait_for(ws.recv(), timeout=5)
+        data = json.loads(raw)
+        if data.get("type") != "status_response":
+            return None
+        return data
 
-            await ws.send(json.dumps({"type": "status"}))
-            raw = await asyncio.wait_for(ws.recv(), timeout=5)
-            data = json.loads(raw)
-            if data.get("type") != "status_response":
-                return None
-            return data
+    async def _fetch_status() -> Optional[Dict[str, Any]]:
+        ws = await _open_status_ws()
+        try:
+            return await _request_status(ws)
+        finally:
+            await ws.close()
 
     def _status_matches(data: Dict[str, Any]) -> bool:
         if data.get("type") != "status_response" or data.get("status") != "ok":
@@ -722,17 +747,33 @@ async def switch_model(request: SwitchModelRequest):
         return True
 
     async def _wait_for_status(timeout_sec: float = 30.0) -> Optional[Dict[str, Any]]:
-        deadline = time.time() + timeout_sec
-        last_error: Optional[str] = None
-        while time.time() < deadline:
-            try:
-                data = await _fetch_status()
-                if data and _status_matches(data):
-                    return data
-            except Exception as e:
-                last_error = str(e)
-            await asyncio.sleep(1.0)
-        return None
+        # Keep one authenticated connection across polls; reconnect only if it drops
+        # (e.g. while the container is being recreated).
+        deadline = time.monotonic() + timeout_sec
+        ws = None
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    if ws is None:
+                        ws = await _open_status_ws()
+                    data = await _request_status(ws)
+                    if data and _status_matches(data):
+                        return data
+                except Exception:
+                    if ws is not None:
+                        try:
+                            await ws.close()
+                        except Exception:
+                            pass
+                        ws = None
+                await asyncio.sleep(1.0)
+            return None
+        finally:
+            if ws is not None:
+                try:
+                    await ws.close()
+                except Exception:
+                    pass
 
     def _read_yaml_provider_fields(provider_name: str, fields: List[str]) -> Dict[str, Any]:
         # Read merged config (base + local override) so we see operator changes too.
@@ -1032,23 +1073,17 @@ async def _verify_model_loaded(model_type: str, get_setting) -> bool:
 
 def _read_env_values(env_file: str, keys: list) -> Dict[str, str]:
     """Read specific environment variable values from .env file."""
-    values = {}
-    if not os.path.exists(env_file):
-        return values
-    
-    with open(env_file, 'r') as f:
-        for line in f:
-            if '=' in line and not line.strip().startswith('#'):
-                key = line.split('=')[0].strip()
-                if key in keys:
-                    value = line.split('=', 1)[1].strip()
-                    values[key] = value
-    return values
+    from settings import _read_env_file
+    env = _read_env_file(env_file)
+    return {key: env[key] for key in keys if key in env}
 
 
-def _update_env_file(env_file: str, updates: Dict[str, str]):
+def _update_env_file(env_file: str, updates: Dict[str, str]) -> EnvUpdateResult:
     """Update environment variables in .env file."""
-    upsert_env_vars(env_file, updates, header="Local AI model management")
+    from settings import invalidate_env_cache
+    result = upsert_env_vars(env_file, updates, header="Local AI model management")
+    invalidate_env_cache()
+    return result
 
 
 # Import docker at module level for switch endpoint
@@ -1058,6 +1093,13 @@ except ImportError:
     docker = None
 
 
+# RebuildRequest flag -> (compose build arg, display name, local-ai-server capability key)
+REBUILD_BACKEND_BUILD_ARGS = MappingProxyType({
+    "include_faster_whisper": ("INCLUDE_FASTER_WHISPER", "Faster-Whisper", "faster_whisper"),
+    "include_melotts": ("INCLUDE_MELOTTS", "MeloTTS", "melotts"),
+})
+
+
 class RebuildRequest(BaseModel):
     """Request to rebuild local-ai-server with specific backends."""
     include_faster_whisper: bool = False
@@ -1089,13 +1131,8 @@ async def rebuild_local_ai_server(request: RebuildRequest):
     from settings import PROJECT_ROOT
     
     # Build the docker compose build command with build args
-    build_args = []
-    if request.include_faster_whisper:
-        build_args.append("--build-arg")
-        build_args.append("INCLUDE_FASTER_WHISPER=true")
-    if request.include_melotts:
-        build_args.append("--build-arg")
-        build_args.append("INCLUDE_MELOTTS=true")
+    selected = [spec for flag, spec in REBUILD_BACKEND_BUILD_ARGS.items() if getattr(request, flag)]
+    build_args = [token for arg_name, _, _ in selected for token in ("--build-arg", f"{arg_name}=true")]
     
     if not build_args:
         return RebuildResponse(
@@ -1106,13 +1143,8 @@ async def rebuild_local_ai_server(request: RebuildRequest):
     
     # Update .env file with new backend settings AND build args BEFORE rebuild
     env_file = os.path.join(PROJECT_ROOT, ".env")
-    env_updates = {}
-    
     # Set build args in .env so docker-compose.yml picks them up
-    if request.include_faster_whisper:
-        env_updates["INCLUDE_FASTER_WHISPER"] = "true"
-    if request.include_melotts:
-        env_updates["INCLUDE_MELOTTS"] = "true"
+    env_updates = {arg_name: "true" for arg_name, _, _ in selected}
     
     if request.stt_backend:
         env_updates["LOCAL_STT_BACKEND"] = request.stt_backend
@@ -1124,8 +1156,38 @@ async def rebuild_local_ai_server(request: RebuildRequest):
         if request.tts_voice:
             env_updates["MELOTTS_VOICE"] = request.tts_voice
     
-    if env_updates:
-        _update_env_file(env_file, env_updates)
+    env_result = _update_env_file(env_file, env_updates)
+    
+    # Fast path: if the running image already ships every requested backend, the
+    # build would be a no-op. Only the env changes (if any) need applying.
+    try:
+        caps_response = await _request_server_capabilities()
+        server_caps = caps_response.get("capabilities", {}) if caps_response.get("type") == "capabilities_response" else {}
+    except Exception as e:
+        logger.debug("Capability probe before rebuild failed: %s", e)
+        server_caps = {}
+    if server_caps and all(server_caps.get(cap_key) for _, _, cap_key in selected):
+        build_arg_names = {arg_name for arg_name, _, _ in selected}
+        runtime_changed = any(
+            key not in build_arg_names for key in (*env_result.updated_keys, *env_result.added_keys)
+        )
+        try:
+            # Build args only matter at image build time; recreate only if runtime settings moved.
+            if runtime_changed:
+                from api.system import _recreate_via_compose
+                await _recreate_via_compose("local_ai_server")
+        except Exception as e:
+            return RebuildResponse(
+                success=False,
+                message=f"Failed to apply backend settings: {str(e)}",
+                phase="error"
+            )
+        backends_enabled = [display_name for _, display_name, _ in selected]
+        return RebuildResponse(
+            success=True,
+            message=f"Already built with {', '.join(backends_enabled)}; skipped image build",
+            phase="complete"
+        )
     
     try:
         ok, warn_or_err = _disk_build_preflight(PROJECT_ROOT)
@@ -1151,17 +1213,30 @@ async def rebuild_local_ai_server(request: RebuildRequest):
             "cd \"$PROJECT_ROOT\"; "
             f"docker compose {compose_prefix}-p asterisk-ai-voice-agent build {build_args_str} local_ai_server"
         )
-        code, out = _run_updater_ephemeral(
+        # Stream build output instead of buffering the whole log; only the tail is
+        # needed for the error message.
+        build_tail: deque = deque(maxlen=50)
+
+        def _on_build_line(line: str) -> None:
+            build_tail.append(line)
+            logger.debug("local_ai_server build: %s", line)
+
+        # The build blocks for minutes; run it on a worker thread so the event loop keeps
+        # serving other Admin UI requests meanwhile.
+        code, _ = await asyncio.to_thread(
+            _run_updater_ephemeral,
             host_root,
             env={"PROJECT_ROOT": host_root},
             command=cmd,
             timeout_sec=1800,
+            on_line=_on_build_line,
         )
 
         if code != 0:
+            out = "\n".join(build_tail)
             return RebuildResponse(
                 success=False,
-                message=f"Docker build failed: {(out or '')[-800:] if out else 'Unknown error'}",
+                message=f"Docker build failed: {out[-800:] if out else 'Unknown error'}",
                 phase="error"
             )
         
@@ -1169,11 +1244,7 @@ async def rebuild_local_ai_server(request: RebuildRequest):
         from api.system import _recreate_via_compose
         await _recreate_via_compose("local_ai_server")
         
-        backends_enabled = []
-        if request.include_faster_whisper:
-            backends_enabled.append("Faster-Whisper")
-        if request.include_melotts:
-            backends_enabled.append("MeloTTS")
+        backends_enabled = [display_name for _, display_name, _ in selected]
         
         warning_suffix = f" (Warning: {warn_or_err})" if warn_or_err else ""
         return RebuildResponse(
@@ -1,19 +1,185 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+import asyncio
+import copy
 import docker
-from typing import List, Optional
+import orjson
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 from pydantic import BaseModel
 import psutil
+import functools
+import hashlib
+import json
 import os
 import shutil
 import logging
 import re
+from datetime import datetime, timezone
+import shlex
+import stat
 import subprocess
+import threading
+import time
 import uuid
 import yaml
+from types import MappingProxyType
 from services.fs import upsert_env_vars
+from services.http_cache import etag_matches
 
 logger = logging.getLogger(__name__)
 
+# Container/host identity cannot change while the process runs.
+_IN_CONTAINER = os.path.exists("/.dockerenv")
+_ARCH = os.uname().machine
+# Resolve the docker CLI once instead of a PATH search on every spawn.
+_DOCKER_BIN = shutil.which("docker") or "docker"
+
+_docker_client: Optional[docker.DockerClient] = None
+# Separate client with no read timeout for following log streams; a build step that is
+# silent for longer than the default 60s would otherwise end the stream.
+_docker_stream_client: Optional[docker.DockerClient] = None
+_docker_client_lock = threading.Lock()
+
+
+def _get_docker_client() -> docker.DockerClient:
+    """Return the process-wide docker-py client, creating it on first use."""
+    global _docker_client
+    client = _docker_client
+    if client is not None:
+        return client
+    with _docker_client_lock:
+        if _docker_client is None:
+            _docker_client = docker.from_env()
+        return _docker_client
+
+
+def _get_docker_stream_client() -> docker.DockerClient:
+    """Return the process-wide docker-py client used for long-lived streams (no read timeout)."""
+    global _docker_stream_client
+    client = _docker_stream_client
+    if client is not None:
+        return client
+    with _docker_client_lock:
+        if _docker_stream_client is None:
+            _docker_stream_client = docker.from_env(timeout=None)
+        return _docker_stream_client
+
+
+async def _run_subprocess(
+    cmd: List[str], *, cwd: Optional[str] = None, timeout_sec: float = 60
+) -> Tuple[int, str, str]:
+    """
+    Run a command without blocking the event loop; returns (returncode, stdout, stderr).
+
+    Raises subprocess.TimeoutExpired (after killing the process) like subprocess.run.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout_sec)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout_sec)
+    return (
+        int(proc.returncode),
+        out.decode("utf-8", errors="replace"),
+        err.decode("utf-8", errors="replace"),
+    )
+
+
+# Bound concurrent Docker API calls from request handlers so bursts (several tabs,
+# restart-all) queue here instead of piling connections onto dockerd.
+_DOCKER_API_CONCURRENCY = 8
+_docker_api_semaphore = asyncio.Semaphore(_DOCKER_API_CONCURRENCY)
+
+
+async def _docker_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking docker-py call in a worker thread, gated by the shared semaphore."""
+    async with _docker_api_semaphore:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+def close_docker_client() -> None:
+    """Close the shared docker-py clients (called on app shutdown)."""
+    global _docker_client, _docker_stream_client
+    with _docker_client_lock:
+        clients = (_docker_client, _docker_stream_client)
+        _docker_client = _docker_stream_client = None
+    for client in clients:
+        if client is None:
+            continue
+        try:
+            client.close()
+        except Exception:
+            logger.debug("Error closing Docker client", exc_info=True)
+
+
+# Long-lived clients for the /health probes so polling does not pay a TCP (and
+# websocket) handshake per request.
+_health_http_client = None
+# (websocket, uri, auth_token) of the open local_ai_server status connection.
+_local_ai_ws: Optional[Tuple[Any, str, str]] = None
+_local_ai_ws_lock = asyncio.Lock()
+
+
+def _get_health_http_client():
+    """Return the shared httpx.AsyncClient used for ai_engine probes."""
+    global _health_http_client
+    if _health_http_client is None or _health_http_client.is_closed:
+        import httpx
+        _health_http_client = httpx.AsyncClient(timeout=httpx.Timeout(5.0, connect=1.5))
+    return _health_http_client
+
+
+# ARI probes (/test-ari, /ari/extension-status): one pooled client per TLS-verify mode,
+# since httpx fixes `verify` per client.
+_ari_http_clients: Dict[bool, Any] = {}
+
+
+def _get_ari_http_client(verify: bool):
+    """Return the shared httpx.AsyncClient for ARI requests with the given TLS verification."""
+    client = _ari_http_clients.get(verify)
+    if client is None or client.is_closed:
+        import httpx
+        from http.cookiejar import CookieJar, DefaultCookiePolicy
+        client = httpx.AsyncClient(
+            timeout=10.0,
+            verify=verify,
+            limits=httpx.Limits(max_connections=20),
+            # Shared across user-supplied ARI hosts/credentials: never store or replay cookies.
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _ari_http_clients[verify] = client
+    return client
+
+
+async def _drop_local_ai_ws() -> None:
+    global _local_ai_ws
+    entry, _local_ai_ws = _local_ai_ws, None
+    if entry is not None:
+        try:
+            await entry[0].close()
+        except Exception:
+            logger.debug("Error closing Local AI health websocket", exc_info=True)
+
+
+async def close_http_clients() -> None:
+    """Close the shared /health and ARI probe connections (called on app shutdown)."""
+    global _health_http_client
+    client, _health_http_client = _health_http_client, None
+    if client is not None:
+        await client.aclose()
+    ari_clients = list(_ari_http_clients.values())
+    _ari_http_clients.clear()
+    for client in ari_clients:
+        await client.aclose()
+    await _drop_local_ai_ws()
+
 
 def _validate_git_ref(ref: str) -> str:
     """
@@ -28,15 +194,15 @@ def _validate_git_ref(ref: str) -> str:
     return r
 
 
-def _extract_mounts(container) -> List[dict]:
+def _extract_mounts(raw_mounts) -> List[dict]:
     """
-    Normalize Docker mount info into a stable, UI-friendly shape.
+    Normalize Docker mount info (the `Mounts` list from the containers API) into a
+    stable, UI-friendly shape.
     Returns a list of dicts with snake_case keys.
     """
     mounts: List[dict] = []
     try:
-        raw_mounts = container.attrs.get("Mounts", []) or []
-        for m in raw_mounts:
+        for m in raw_mounts or []:
             mounts.append(
                 {
                     "type": m.get("Type"),
@@ -50,7 +216,7 @@ def _extract_mounts(container) -> List[dict]:
                 }
             )
     except Exception as e:
-        logger.debug("Error extracting mounts for %s: %s", getattr(container, "name", "<unknown>"), e)
+        logger.debug("Error extracting mounts: %s", e)
     return mounts
 
 
@@ -63,12 +229,8 @@ def _dotenv_value(key: str) -> Optional[str]:
     so relying on os.environ alone can appear "stale" after editing `.env` without recreating.
     """
     try:
-        from settings import ENV_PATH
-        if not os.path.exists(ENV_PATH):
-            return None
-        from dotenv import dotenv_values
-        raw = dotenv_values(ENV_PATH)
-        val = raw.get(key)
+        from settings import ENV_PATH, _read_env_file
+        val = _read_env_file(ENV_PATH).get(key)
         if val is None:
             return None
         return str(val).strip()
@@ -76,9 +238,27 @@ def _dotenv_value(key: str) -> Optional[str]:
         return None
 
 
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
 def _is_truthy_env(value: Optional[str]) -> bool:
-    raw = (value or "").strip().lower()
-    return raw in {"1", "true", "yes", "on"}
+    return (value or "").strip().lower() in _TRUTHY_ENV_VALUES
+
+
+# Compose services the Admin UI manages (container name == service name).
+_AAVA_SERVICE_MAP = MappingProxyType({
+    "ai_engine": "ai_engine",
+    "admin_ui": "admin_ui",
+    "local_ai_server": "local_ai_server",
+})
+# Legacy hyphenated service names -> canonical underscored names.
+_LEGACY_SERVICE_NAMES = MappingProxyType({
+    "ai-engine": "ai_engine",
+    "admin-ui": "admin_ui",
+    "local-ai-server": "local_ai_server",
+})
+# Accept both canonical underscored and legacy hyphenated service names as inputs.
+_AAVA_CONTAINER_NAME_MAP = MappingProxyType({**_AAVA_SERVICE_MAP, **_LEGACY_SERVICE_NAMES})
 
 
 def _compose_files_flags_for_service(service_name: str) -> str:
@@ -89,11 +269,7 @@ def _compose_files_flags_for_service(service_name: str) -> str:
     otherwise UI-triggered recreate/start can silently drop GPU device requests.
     """
     # Normalize legacy service names.
-    svc = {
-        "local-ai-server": "local_ai_server",
-        "ai-engine": "ai_engine",
-        "admin-ui": "admin_ui",
-    }.get(service_name, service_name)
+    svc = _LEGACY_SERVICE_NAMES.get(service_name, service_name)
 
     if svc != "local_ai_server":
         return ""
@@ -181,122 +357,306 @@ class ContainerInfo(BaseModel):
     state: str
 
 
-def _safe_container_image_name(container) -> str:
+# Docker StartedAt, e.g. 2025-12-03T06:23:45.362413338+00:00 or ...338Z (nanoseconds).
+_DOCKER_STARTED_AT_RE = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)(Z|[+-]\d{2}:\d{2})?")
+
+
+def _format_uptime(started_str: str, now: datetime) -> Optional[str]:
+    """Uptime since a Docker StartedAt timestamp as "Xd Yh Zm" / "Yh Zm" / "Zm"."""
+    if not started_str or started_str == "0001-01-01T00:00:00Z":
+        return None
+    # Docker uses nanoseconds (9 digits), Python only handles microseconds (6)
+    match = _DOCKER_STARTED_AT_RE.match(started_str)
+    if match:
+        frac = match.group(2)[:6].ljust(6, "0")
+        tz = match.group(3) or "+00:00"
+        if tz == "Z":
+            tz = "+00:00"
+        started_dt = datetime.fromisoformat(f"{match.group(1)}.{frac}{tz}")
+    else:
+        started_dt = datetime.fromisoformat(started_str.replace("Z", "+00:00"))
+    delta = now - started_dt
+    days = delta.days
+    hours, remainder = divmod(delta.seconds, 3600)
+    minutes, _ = divmod(remainder, 60)
+    if days > 0:
+        return f"{days}d {hours}h {minutes}m"
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+async def _container_started_at(client: docker.DockerClient, container_id: str) -> Optional[str]:
+    try:
+        attrs = await _docker_call(client.api.inspect_container, container_id)
+    except docker.errors.NotFound:
+        return None
+    return (attrs.get("State") or {}).get("StartedAt") or None
+
+
+def _container_list_image_name(entry: dict) -> str:
+    """Human-readable image for a list-API entry (image ref, or short id if untagged/pruned)."""
+    image = str(entry.get("Image") or "").strip()
+    if not image:
+        return "unknown (image unavailable)"
+    if image.startswith("sha256:"):
+        return image[:17]
+    return image
+
+
+def _container_list_ports(entry: dict) -> List[str]:
+    """Published ports as "host:container/proto" strings."""
+    ports = []
+    for p in entry.get("Ports") or []:
+        host_port = p.get("PublicPort")
+        if host_port:
+            ports.append(f"{host_port}:{p.get('PrivatePort')}/{p.get('Type', 'tcp')}")
+    return ports
+
+
+# Short-TTL cache for polled read-only endpoints: concurrent/overlapping polls (several
+# tabs, dashboard + system page) share one Docker/psutil query per window.
+_RESPONSE_CACHE_TTL_SEC = 1.0
+# /health opens a websocket to local_ai_server and HTTP probes to ai_engine per call.
+_HEALTH_CACHE_TTL_SEC = 2.0
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+_response_cache_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def _cached_response(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl_sec: float = _RESPONSE_CACHE_TTL_SEC,
+) -> Any:
+    """Return the cached value for `key` if fresh, else compute it once (single-flight)."""
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl_sec:
+        return entry[1]
+    lock = _response_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        entry = _response_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl_sec:
+            return entry[1]
+        value = await compute()
+        _response_cache[key] = (time.monotonic(), value)
+        return value
+
+
+@router.get("/containers", response_class=ORJSONResponse)
+async def get_containers():
+    try:
+        return await _cached_response("containers", _list_containers)
+    except Exception as e:
+        logger.error("Error listing containers: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _list_containers() -> List[dict]:
+    client = _get_docker_client()
+    # One GET /containers/json returns name, state, status, ports and mounts for every
+    # container; docker-py's high-level list() would inspect each container separately.
+    entries = await _docker_call(client.api.containers, all=True)
+    # The list API has no start time (Created goes stale across stop/start), so running
+    # containers - the only ones that show uptime - are inspected, concurrently.
+    running = [e.get("Id") for e in entries if e.get("State") == "running"]
+    started = dict(zip(running, await asyncio.gather(
+        *(_container_started_at(client, cid) for cid in running), return_exceptions=True
+    )))
+    now = datetime.now(timezone.utc)
+    result = []
+    for entry in entries:
+        names = entry.get("Names") or []
+        state = entry.get("State") or "unknown"
+        
+        uptime = None
+        started_at = started.get(entry.get("Id"))
+        if isinstance(started_at, BaseException):
+            logger.debug("Error inspecting container %s: %s", entry.get("Id"), started_at)
+            started_at = None
+        if started_at:
+            try:
+                uptime = _format_uptime(started_at, now)
+            except Exception as e:
+                logger.debug("Error calculating uptime for %s: %s", entry.get("Id"), e)
+        
+        result.append({
+            "id": entry.get("Id"),
+            "name": names[0].lstrip("/") if names else (entry.get("Id") or "")[:12],
+            "image": _container_list_image_name(entry),
+            "status": state,
+            "state": state,
+            "uptime": uptime,
+            "started_at": started_at,
+            "ports": _container_list_ports(entry),
+            "mounts": _extract_mounts(entry.get("Mounts")),
+        })
+    return result
+
+
+# Voice suffix in legacy local_ai_server TTS display strings, e.g. "Kokoro (af_heart)".
+_TTS_DISPLAY_VOICE_RE = re.compile(r"\(([^()]*)\)")
+
+# Container lifecycle actions forwarded by /containers/events.
+_CONTAINER_EVENT_ACTIONS = frozenset({
+    "create", "start", "restart", "stop", "die", "kill", "pause", "unpause", "destroy",
+})
+_CONTAINER_EVENTS_KEEPALIVE_SEC = 15.0
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/containers/events")
+async def stream_container_events():
     """
-    Resolve a human-readable image name without failing the whole containers endpoint.
+    Server-Sent Events stream of container state changes.
 
-    Docker can return ImageNotFound for stale image IDs after prune/rebuild windows.
+    Sends one `snapshot` event (same payload as GET /containers), then a
+    `container` event for each Docker lifecycle event, so the UI can subscribe
+    instead of polling /containers.
     """
+    from fastapi.responses import StreamingResponse
+
+    client = _get_docker_client()
     try:
-        image = container.image
-        tags = getattr(image, "tags", None) or []
-        if tags:
-            return tags[0]
-        short_id = getattr(image, "short_id", "")
-        if short_id:
-            return short_id
-    except docker.errors.ImageNotFound:
-        pass
+        # Subscribe before taking the snapshot so no event falls in between.
+        events = await _docker_call(client.events, decode=True, filters={"type": "container"})
     except Exception as e:
-        logger.debug("Error resolving image object for container %s: %s", getattr(container, "name", "<unknown>"), e)
+        logger.error("Error subscribing to Docker events: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(
+        _container_event_stream(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    try:
-        config_image = str((container.attrs.get("Config", {}) or {}).get("Image") or "").strip()
-        if config_image:
-            return f"{config_image} (missing locally)"
-        image_id = str(container.attrs.get("Image") or "").strip()
-        if image_id:
-            if image_id.startswith("sha256:") and len(image_id) > 19:
-                return f"{image_id[:19]}... (missing locally)"
-            return f"{image_id} (missing locally)"
-    except Exception:
-        pass
 
-    return "unknown (image unavailable)"
+async def _container_event_stream(events) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def _put(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # event loop already closed (shutdown)
 
+    def _pump() -> None:
+        # The docker-py event stream is a blocking iterator; read it on a dedicated
+        # thread (not the default executor) since it lives as long as the client.
+        try:
+            for event in events:
+                _put(event)
+        except Exception:
+            logger.debug("Docker event stream ended", exc_info=True)
+        finally:
+            _put(None)
 
-@router.get("/containers")
-async def get_containers():
+    threading.Thread(target=_pump, name="docker-events", daemon=True).start()
     try:
-        from datetime import datetime, timezone
-        
-        client = docker.from_env()
-        containers = client.containers.list(all=True)
-        result = []
-        for c in containers:
-            # Get image name
-            image_name = _safe_container_image_name(c)
-            
-            # Calculate uptime from StartedAt
-            uptime = None
-            started_at = None
-            if c.status == "running":
-                try:
-                    started_str = c.attrs['State'].get('StartedAt', '')
-                    if started_str and started_str != '0001-01-01T00:00:00Z':
-                        # Docker uses nanoseconds (9 digits), Python only handles microseconds (6)
-                        # Truncate nanoseconds to microseconds and normalize timezone
-                        import re
-                        # Match: 2025-12-03T06:23:45.362413338+00:00 or 2025-12-03T06:23:45.362413338Z
-                        match = re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)(Z|[+-]\d{2}:\d{2})?', started_str)
-                        if match:
-                            base = match.group(1)
-                            frac = match.group(2)[:6].ljust(6, '0')  # Truncate to 6 digits
-                            tz = match.group(3) or '+00:00'
-                            if tz == 'Z':
-                                tz = '+00:00'
-                            normalized = f"{base}.{frac}{tz}"
-                            started_dt = datetime.fromisoformat(normalized)
-                        else:
-                            # Fallback for simple format
-                            started_dt = datetime.fromisoformat(started_str.replace('Z', '+00:00'))
-                        
-                        started_at = started_str
-                        now = datetime.now(timezone.utc)
-                        delta = now - started_dt
-                        
-                        # Format uptime nicely
-                        days = delta.days
-                        hours, remainder = divmod(delta.seconds, 3600)
-                        minutes, _ = divmod(remainder, 60)
-                        
-                        if days > 0:
-                            uptime = f"{days}d {hours}h {minutes}m"
-                        elif hours > 0:
-                            uptime = f"{hours}h {minutes}m"
-                        else:
-                            uptime = f"{minutes}m"
-                except Exception as e:
-                    logger.debug("Error calculating uptime for %s: %s", c.name, e)
-            
-            # Get exposed ports
-            ports = []
+        # Fresh listing, not the short-TTL cache: a cached list could predate the
+        # subscription and lose events that happened in between.
+        yield _sse("snapshot", await _list_containers())
+        while True:
             try:
-                port_bindings = c.attrs.get('NetworkSettings', {}).get('Ports', {})
-                for container_port, host_bindings in (port_bindings or {}).items():
-                    if host_bindings:
-                        for binding in host_bindings:
-                            host_port = binding.get('HostPort', '')
-                            if host_port:
-                                ports.append(f"{host_port}:{container_port}")
-            except Exception:
-                pass
-            
-            result.append({
-                "id": c.id,
-                "name": c.name,
-                "image": image_name,
-                "status": c.status,
-                "state": c.attrs.get("State", {}).get("Status", c.status),
-                "uptime": uptime,
-                "started_at": started_at,
-                "ports": ports,
-                "mounts": _extract_mounts(c),
+                event = await asyncio.wait_for(queue.get(), timeout=_CONTAINER_EVENTS_KEEPALIVE_SEC)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                break
+            action = (event.get("Action") or event.get("status") or "").split(":", 1)[0]
+            if action not in _CONTAINER_EVENT_ACTIONS:
+                continue
+            # Make the next GET /containers reflect the change immediately.
+            _response_cache.pop("containers", None)
+            actor = event.get("Actor") or {}
+            attributes = actor.get("Attributes") or {}
+            yield _sse("container", {
+                "id": actor.get("ID") or event.get("id"),
+                "name": attributes.get("name"),
+                "image": attributes.get("image"),
+                "action": action,
+                "time": event.get("time"),
             })
-        return result
-    except Exception as e:
-        logger.error("Error listing containers: %s", e, exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Closing the stream unblocks the pump thread.
+        events.close()
+
+
+def _compose_config_hash(service_name: str) -> Optional[str]:
+    """
+    Ask compose for the service's current config hash (covers .env via env_file).
+
+    Runs `docker compose config --hash` in the updater-runner so paths resolve on the host,
+    like every other compose call here. Returns None if compose can't tell us.
+    """
+    compose_files = _compose_files_flags_for_service(service_name)
+    compose_prefix = f"{compose_files} " if compose_files else ""
+    try:
+        host_root = _project_host_root_from_admin_ui_container()
+        code, out = _run_updater_ephemeral(
+            host_root,
+            env={"PROJECT_ROOT": host_root},
+            command=(
+                "set -euo pipefail; "
+                "cd \"$PROJECT_ROOT\"; "
+                f"docker compose {compose_prefix}-p asterisk-ai-voice-agent config --hash {service_name}"
+            ),
+            timeout_sec=60,
+            capture_stderr=False,
+        )
+    except Exception:
+        logger.debug("compose config --hash failed for %s", _sanitize_for_log(service_name), exc_info=True)
+        return None
+    if code != 0:
+        return None
+    # Output is "<service> <hash>" per line.
+    for line in (out or "").splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] == service_name:
+            return parts[1]
+    return None
+
+
+async def _start_existing_container(container_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Start an existing (stopped) container via the Docker SDK.
+
+    Only taken when the container's compose config hash still matches compose's, i.e. the
+    compose files and .env are unchanged since it was created; otherwise the service is
+    recreated through compose so the changes apply. Returns None when the container does
+    not exist, its config hash can't be checked, or the Docker API call fails, so the
+    caller can fall back to `docker compose up`.
+    """
+    safe_container_name = _sanitize_for_log(container_name)
+    try:
+        client = _get_docker_client()
+        container = await _docker_call(client.containers.get, container_name)
+        if container.status != "running":
+            created_hash = (container.labels or {}).get("com.docker.compose.config-hash")
+            current_hash = await asyncio.to_thread(_compose_config_hash, container_name)
+            if not created_hash or not current_hash:
+                return None
+            if created_hash != current_hash:
+                logger.info("Compose config changed for %s; recreating instead of starting", safe_container_name)
+                return await _recreate_via_compose(container_name)
+            await _docker_call(container.start)
+        logger.info("Container %s started via Docker SDK", safe_container_name)
+    except HTTPException:
+        raise
+    except docker.errors.NotFound:
+        return None
+    except Exception:
+        logger.warning("Docker SDK start failed for %s; falling back to compose", safe_container_name, exc_info=True)
+        return None
+    return {
+        "status": "success",
+        "method": "docker-sdk",
+        "output": f"Container {safe_container_name} started",
+    }
+
 
 @router.post("/containers/{container_id}/start")
 async def start_container(container_id: str):
@@ -304,28 +664,16 @@ async def start_container(container_id: str):
     import subprocess
     
     # Map container names to docker compose service names (canonical)
-    service_map = {
-        "ai_engine": "ai_engine",
-        "admin_ui": "admin_ui",
-        "local_ai_server": "local_ai_server",
-    }
-    # Accept both canonical underscored and legacy hyphenated service names as inputs.
-    container_name_map = {
-        "ai_engine": "ai_engine",
-        "admin_ui": "admin_ui",
-        "local_ai_server": "local_ai_server",
-        "ai-engine": "ai_engine",
-        "admin-ui": "admin_ui",
-        "local-ai-server": "local_ai_server",
-    }
+    service_map = _AAVA_SERVICE_MAP
+    container_name_map = _AAVA_CONTAINER_NAME_MAP
     
     service_name = service_map.get(container_id)
     
     # If not in map, it might be an ID or a raw name.
     if not service_name:
         try:
-            client = docker.from_env()
-            container = client.containers.get(container_id)
+            client = _get_docker_client()
+            container = await _docker_call(client.containers.get, container_id)
             name = container.name.lstrip('/')
             service_name = service_map.get(name)
         except:
@@ -339,6 +687,13 @@ async def start_container(container_id: str):
     if service_name not in set(service_map.values()):
         raise HTTPException(status_code=400, detail="Only AAVA services can be started from Admin UI")
     
+    # Fast path: if the service container already exists with an unchanged compose
+    # config, start it through the Docker API instead of `compose up --build`.
+    # Compose is only needed when the container has to be created (or built).
+    started = await _start_existing_container(service_name)
+    if started is not None:
+        return started
+
     host_root = _project_host_root_from_admin_ui_container()
     logger.info("Starting %s via updater-runner (host_root=%s)", _sanitize_for_log(service_name), _sanitize_for_log(host_root))
 
@@ -355,7 +710,8 @@ async def start_container(container_id: str):
     try:
         if service_name == "local_ai_server":
             # Fast path: start without build if the image already exists.
-            code, out = _run_updater_ephemeral(
+            code, out = await asyncio.to_thread(
+                _run_updater_ephemeral,
                 host_root,
                 env={"PROJECT_ROOT": host_root},
                 command=_compose_up_cmd(service_name, build=False),
@@ -373,7 +729,8 @@ async def start_container(container_id: str):
                 "requires build",
             ]
             if any(m.lower() in err.lower() for m in needs_build_markers):
-                code2, out2 = _run_updater_ephemeral(
+                code2, out2 = await asyncio.to_thread(
+                    _run_updater_ephemeral,
                     host_root,
                     env={"PROJECT_ROOT": host_root},
                     command=_compose_up_cmd(service_name, build=True),
@@ -385,7 +742,8 @@ async def start_container(container_id: str):
 
             raise HTTPException(status_code=500, detail=f"Failed to start: {err[:800] or 'Unknown error'}")
 
-        code, out = _run_updater_ephemeral(
+        code, out = await asyncio.to_thread(
+            _run_updater_ephemeral,
             host_root,
             env={"PROJECT_ROOT": host_root},
             command=_compose_up_cmd(service_name, build=True),
@@ -411,22 +769,22 @@ async def _check_active_calls() -> dict:
     import httpx
     
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            for url in [
-                "http://127.0.0.1:15000/sessions/stats",
-                "http://ai_engine:15000/sessions/stats",
-                "http://ai-engine:15000/sessions/stats",
-            ]:
-                try:
-                    resp = await client.get(url)
-                    if resp.status_code != 200:
-                        continue
-
-                    data = resp.json()
-                    active_calls = data.get("active_calls", data.get("active_sessions", 0))
-                    return {"active_calls": active_calls, "reachable": True}
-                except httpx.ConnectError:
+        client = _get_health_http_client()
+        for url in [
+            "http://127.0.0.1:15000/sessions/stats",
+            "http://ai_engine:15000/sessions/stats",
+            "http://ai-engine:15000/sessions/stats",
+        ]:
+            try:
+                resp = await client.get(url)
+                if resp.status_code != 200:
                     continue
+
+                data = resp.json()
+                active_calls = data.get("active_calls", data.get("active_sessions", 0))
+                return {"active_calls": active_calls, "reachable": True}
+            except httpx.ConnectError:
+                continue
     except Exception:
         logger.debug("Could not check active calls", exc_info=True)
     
@@ -447,21 +805,8 @@ async def restart_container(container_id: str, force: bool = False, recreate: bo
         Success response with health_status, or warning if active calls and not forced.
     """
     # Map container names to docker compose service names (canonical)
-    service_map = {
-        "ai_engine": "ai_engine",
-        "admin_ui": "admin_ui",
-        "local_ai_server": "local_ai_server",
-    }
-    
-    # Accept both canonical underscored and legacy hyphenated service names as inputs.
-    container_name_map = {
-        "ai_engine": "ai_engine",
-        "admin_ui": "admin_ui",
-        "local_ai_server": "local_ai_server",
-        "ai-engine": "ai_engine",
-        "admin-ui": "admin_ui",
-        "local-ai-server": "local_ai_server",
-    }
+    service_map = _AAVA_SERVICE_MAP
+    container_name_map = _AAVA_CONTAINER_NAME_MAP
     
     # Resolve container name
     is_known = False
@@ -510,8 +855,9 @@ async def restart_container(container_id: str, force: bool = False, recreate: bo
         async def _restart_admin_ui_later():
             try:
                 await asyncio.sleep(0.75)
-                client = docker.from_env()
-                client.containers.get("admin_ui").restart(timeout=10)
+                client = _get_docker_client()
+                container = await _docker_call(client.containers.get, "admin_ui")
+                await _docker_call(container.restart, timeout=10)
             except Exception as e:
                 logger.error("Failed to restart admin_ui via Docker SDK: %s", e)
 
@@ -528,11 +874,11 @@ async def restart_container(container_id: str, force: bool = False, recreate: bo
     
     try:
         # A5: Use Docker SDK for cleaner restart (no stop/rm/up)
-        client = docker.from_env()
-        container = client.containers.get(container_name)
+        client = _get_docker_client()
+        container = await _docker_call(client.containers.get, container_name)
         
-        # Restart with 10 second timeout for graceful stop
-        container.restart(timeout=10)
+        # Restart with 10 second timeout for graceful stop (off the event loop)
+        await _docker_call(container.restart, timeout=10)
         
         logger.info("Container %s restarted successfully via Docker SDK", safe_container_name)
         payload = {
@@ -567,7 +913,7 @@ async def restart_container(container_id: str, force: bool = False, recreate: bo
         raise HTTPException(status_code=500, detail="Failed to restart container")
 
 
-async def _start_via_compose(container_id: str, service_map: dict):
+async def _start_via_compose(container_id: str, service_map: Mapping[str, str]):
     """Helper to start a container via docker-compose."""
     service_name = service_map.get(container_id)
     if not service_name:
@@ -585,7 +931,8 @@ async def _start_via_compose(container_id: str, service_map: dict):
             f"docker compose {compose_prefix}-p asterisk-ai-voice-agent up -d {build_flag} {service_name}"
         )
 
-        code, out = _run_updater_ephemeral(
+        code, out = await asyncio.to_thread(
+            _run_updater_ephemeral,
             host_root,
             env={"PROJECT_ROOT": host_root},
             command=cmd,
@@ -613,12 +960,7 @@ async def _recreate_via_compose(service_name: str, health_check: bool = True):
     host_root = _project_host_root_from_admin_ui_container()
 
     # Normalize legacy hyphenated service names to canonical underscored service names.
-    legacy_to_canonical = {
-        "ai-engine": "ai_engine",
-        "admin-ui": "admin_ui",
-        "local-ai-server": "local_ai_server",
-    }
-    service_name = legacy_to_canonical.get(service_name, service_name)
+    service_name = _LEGACY_SERVICE_NAMES.get(service_name, service_name)
     if not _is_safe_container_identifier(service_name):
         raise HTTPException(status_code=400, detail="Invalid service name")
     
@@ -649,13 +991,15 @@ async def _recreate_via_compose(service_name: str, health_check: bool = True):
     safe_container_name = _sanitize_for_log(container_name)
 
     try:
-        # First stop and remove the existing container to avoid name conflicts
+        # First stop and remove the existing container to avoid name conflicts.
+        # The graceful stop gives ai_engine/local_ai_server 10s to tear down calls and
+        # flush state (a forced remove alone would SIGKILL immediately); the remove is
+        # forced only so it doesn't need a separate get.
         try:
-            client = docker.from_env()
-            container = client.containers.get(container_name)
+            client = _get_docker_client()
             logger.info("Stopping container %s before recreate", safe_container_name)
-            container.stop(timeout=10)
-            container.remove()
+            await _docker_call(client.api.stop, container_name, timeout=10)
+            await _docker_call(client.api.remove_container, container_name, force=True)
             logger.info("Container %s stopped and removed", safe_container_name)
         except docker.errors.NotFound:
             logger.info("Container %s not found, will create fresh", safe_container_name)
@@ -671,7 +1015,8 @@ async def _recreate_via_compose(service_name: str, health_check: bool = True):
             f"docker compose {compose_prefix}-p asterisk-ai-voice-agent up -d --force-recreate --no-build {service_name}"
         )
         timeout_sec = 600 if service_name == "local_ai_server" else 300
-        code, out = _run_updater_ephemeral(
+        code, out = await asyncio.to_thread(
+            _run_updater_ephemeral,
             host_root,
             env={"PROJECT_ROOT": host_root},
             command=cmd,
@@ -883,32 +1228,36 @@ async def reload_ai_engine():
 @router.get("/metrics")
 async def get_system_metrics():
     try:
-        # interval=None is non-blocking, returns usage since last call
-        cpu_percent = psutil.cpu_percent(interval=None)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        return {
-            "cpu": {
-                "percent": cpu_percent,
-                "count": psutil.cpu_count()
-            },
-            "memory": {
-                "total": memory.total,
-                "available": memory.available,
-                "percent": memory.percent,
-                "used": memory.used
-            },
-            "disk": {
-                "total": disk.total,
-                "free": disk.free,
-                "percent": disk.percent
-            }
-        }
+        return await _cached_response("metrics", _collect_system_metrics)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _collect_system_metrics() -> dict:
+    # interval=None is non-blocking, returns usage since last call
+    cpu_percent = psutil.cpu_percent(interval=None)
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    
+    return {
+        "cpu": {
+            "percent": cpu_percent,
+            "count": psutil.cpu_count()
+        },
+        "memory": {
+            "total": memory.total,
+            "available": memory.available,
+            "percent": memory.percent,
+            "used": memory.used
+        },
+        "disk": {
+            "total": disk.total,
+            "free": disk.free,
+            "percent": disk.percent
+        }
+    }
+
+
 @router.get("/docker/disk-usage")
 async def get_docker_disk_usage():
     """
@@ -920,7 +1269,7 @@ async def get_docker_disk_usage():
     try:
         # Run docker system df to get disk usage
         result = subprocess.run(
-            ["docker", "system", "df", "-v", "--format", "json"],
+            [_DOCKER_BIN, "system", "df", "-v", "--format", "json"],
             capture_output=True,
             text=True,
             timeout=30
@@ -929,7 +1278,7 @@ async def get_docker_disk_usage():
         if result.returncode != 0:
             # Fallback to non-JSON format
             result = subprocess.run(
-                ["docker", "system", "df"],
+                [_DOCKER_BIN, "system", "df"],
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -1111,7 +1460,7 @@ async def prune_docker_resources(request: PruneRequest):
         # Use -a to remove ALL build cache, not just unused layers
         if request.prune_build_cache:
             result = subprocess.run(
-                ["docker", "builder", "prune", "-a", "-f"],
+                [_DOCKER_BIN, "builder", "prune", "-a", "-f"],
                 capture_output=True,
                 text=True,
                 timeout=120
@@ -1131,7 +1480,7 @@ async def prune_docker_resources(request: PruneRequest):
         # Use -a to remove ALL unused images, not just dangling ones
         if request.prune_images:
             result = subprocess.run(
-                ["docker", "image", "prune", "-a", "-f"],
+                [_DOCKER_BIN, "image", "prune", "-a", "-f"],
                 capture_output=True,
                 text=True,
                 timeout=120
@@ -1147,7 +1496,7 @@ async def prune_docker_resources(request: PruneRequest):
         # Prune stopped containers
         if request.prune_containers:
             result = subprocess.run(
-                ["docker", "container", "prune", "-f"],
+                [_DOCKER_BIN, "container", "prune", "-f"],
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -1160,7 +1509,7 @@ async def prune_docker_resources(request: PruneRequest):
         # Prune unused volumes (DANGEROUS)
         if request.prune_volumes:
             result = subprocess.run(
-                ["docker", "volume", "prune", "-f"],
+                [_DOCKER_BIN, "volume", "prune", "-f"],
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -1172,7 +1521,7 @@ async def prune_docker_resources(request: PruneRequest):
         
         # Run system prune to get total reclaimed (without volumes for safety)
         result = subprocess.run(
-            ["docker", "system", "df"],
+            [_DOCKER_BIN, "system", "df"],
             capture_output=True,
             text=True,
             timeout=30
@@ -1191,11 +1540,15 @@ async def prune_docker_resources(request: PruneRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/health")
+@router.get("/health", response_class=ORJSONResponse)
 async def get_system_health():
     """
     Aggregate health status from Local AI Server and AI Engine.
     """
+    return await _cached_response("health", _collect_system_health, ttl_sec=_HEALTH_CACHE_TTL_SEC)
+
+
+async def _collect_system_health():
     def _dedupe_preserve_order(items: List[str]) -> List[str]:
         seen = set()
         out: List[str] = []
@@ -1206,11 +1559,60 @@ async def get_system_health():
             out.append(item)
         return out
 
+    def _local_ai_result(data: dict, uri: str, env_uri: str, candidates: List[str], errors_by_uri: dict) -> dict:
+        # Prefer explicit fields from local-ai-server (v2 protocol), fallback to heuristics.
+        kroko = data.get("kroko") or {}
+        kokoro = data.get("kokoro") or {}
+
+        kroko_embedded = bool(kroko.get("embedded", False))
+        kroko_port = kroko.get("port")
+
+        kokoro_mode = (kokoro.get("mode") or "local").lower()
+        kokoro_voice = kokoro.get("voice")
+
+        # Back-compat for older payloads that didn't include structured metadata
+        if not kokoro_voice:
+            tts_display = data.get("models", {}).get("tts", {}).get("display") or ""
+            match = _TTS_DISPLAY_VOICE_RE.search(tts_display)
+            if match:
+                kokoro_voice = match.group(1)
+
+        data["kroko_embedded"] = kroko_embedded
+        data["kroko_port"] = kroko_port
+        data["kokoro_mode"] = kokoro_mode
+        data["kokoro_voice"] = kokoro_voice
+        
+        warning = None
+        if env_uri and uri != env_uri:
+            warning = (
+                f"HEALTH_CHECK_LOCAL_AI_URL is set but unreachable ({env_uri}); "
+                f"connected via fallback ({uri})."
+            )
+        return {
+            "status": "connected",
+            "details": data,
+            "probe": {
+                "selected": uri,
+                "attempted": candidates,
+                "errors": errors_by_uri,
+            }
+            ,
+            "warning": warning,
+        }
+
+    async def _local_ai_status(websocket) -> Optional[dict]:
+        await websocket.send(json.dumps({"type": "status"}))
+        logger.debug("Local AI sent, waiting for response...")
+        response = await asyncio.wait_for(websocket.recv(), timeout=5)
+        logger.debug("Local AI response: %s...", response[:100])
+        data = orjson.loads(response)
+        return data if data.get("type") == "status_response" else None
+
     async def check_local_ai():
+        global _local_ai_ws
         try:
             import websockets
             import json
-            import asyncio
             from settings import get_setting
             
             env_uri = (_dotenv_value("HEALTH_CHECK_LOCAL_AI_URL") or "").strip()
@@ -1223,71 +1625,50 @@ async def get_system_health():
                 "ws://local-ai-server:8765",
                 "ws://host.docker.internal:8765",
             ])
+            auth_token = (get_setting("LOCAL_WS_AUTH_TOKEN", os.getenv("LOCAL_WS_AUTH_TOKEN", "")) or "").strip()
 
             last_error: Optional[str] = None
             errors_by_uri: dict = {}
-            for uri in candidates:
-                logger.debug("Checking Local AI at %s", uri)
-                try:
-                    async with websockets.connect(uri, open_timeout=2.5) as websocket:
-                        logger.debug("Local AI connected, sending status...")
-                        auth_token = (get_setting("LOCAL_WS_AUTH_TOKEN", os.getenv("LOCAL_WS_AUTH_TOKEN", "")) or "").strip()
-                        if auth_token:
-                            await websocket.send(json.dumps({"type": "auth", "auth_token": auth_token}))
-                            raw = await asyncio.wait_for(websocket.recv(), timeout=5)
-                            auth_data = json.loads(raw)
-                            if auth_data.get("type") != "auth_response" or auth_data.get("status") != "ok":
-                                raise RuntimeError(f"Local AI auth failed: {auth_data}")
-                        await websocket.send(json.dumps({"type": "status"}))
-                        logger.debug("Local AI sent, waiting for response...")
-                        response = await asyncio.wait_for(websocket.recv(), timeout=5)
-                        logger.debug("Local AI response: %s...", response[:100])
-                        data = json.loads(response)
-                        if data.get("type") == "status_response":
-                            # Prefer explicit fields from local-ai-server (v2 protocol), fallback to heuristics.
-                            kroko = data.get("kroko") or {}
-                            kokoro = data.get("kokoro") or {}
-
-                            kroko_embedded = bool(kroko.get("embedded", False))
-                            kroko_port = kroko.get("port")
-
-                            kokoro_mode = (kokoro.get("mode") or "local").lower()
-                            kokoro_voice = kokoro.get("voice")
-
-                            # Back-compat for older payloads that didn't include structured metadata
-                            if not kokoro_voice:
-                                tts_display = data.get("models", {}).get("tts", {}).get("display") or ""
-                                if "(" in tts_display and ")" in tts_display:
-                                    kokoro_voice = tts_display.split("(")[1].rstrip(")")
-
-                            data["kroko_embedded"] = kroko_embedded
-                            data["kroko_port"] = kroko_port
-                            data["kokoro_mode"] = kokoro_mode
-                            data["kokoro_voice"] = kokoro_voice
-                            
-                            warning = None
-                            if env_uri and uri != env_uri:
-                                warning = (
-                                    f"HEALTH_CHECK_LOCAL_AI_URL is set but unreachable ({env_uri}); "
-                                    f"connected via fallback ({uri})."
-                                )
-                            return {
-                                "status": "connected",
-                                "details": data,
-                                "probe": {
-                                    "selected": uri,
-                                    "attempted": candidates,
-                                    "errors": errors_by_uri,
-                                }
-                                ,
-                                "warning": warning,
-                            }
-                        else:
-                            last_error = "Invalid response type"
-                except Exception as e:
-                    last_error = f"{type(e).__name__}: {str(e)}"
-                    errors_by_uri[uri] = last_error
-                    continue
+            # One status exchange at a time on the shared connection.
+            async with _local_ai_ws_lock:
+                # Reuse the open connection unless the configured URL or token changed.
+                cached = _local_ai_ws
+                if cached is not None:
+                    _, cached_uri, cached_token = cached
+                    if cached_token == auth_token and cached_uri in candidates and (not env_uri or cached_uri == env_uri):
+                        try:
+                            data = await _local_ai_status(cached[0])
+                            if data is not None:
+                                return _local_ai_result(data, cached_uri, env_uri, candidates, errors_by_uri)
+                        except Exception:
+                            logger.debug("Local AI health websocket went stale; reconnecting", exc_info=True)
+                    await _drop_local_ai_ws()
+
+                for uri in candidates:
+                    logger.debug("Checking Local AI at %s", uri)
+                    try:
+                        websocket = await websockets.connect(uri, open_timeout=2.5)
+                        try:
+                            logger.debug("Local AI connected, sending status...")
+                            if auth_token:
+                                await websocket.send(json.dumps({"type": "auth", "auth_token": auth_token}))
+                                raw = await asyncio.wait_for(websocket.recv(), timeout=5)
+                                auth_data = orjson.loads(raw)
+                                if auth_data.get("type") != "auth_response" or auth_data.get("status") != "ok":
+                                    raise RuntimeError(f"Local AI auth failed: {auth_data}")
+                            data = await _local_ai_status(websocket)
+                        except BaseException:
+                            await websocket.close()
+                            raise
+                        if data is not None:
+                            _local_ai_ws = (websocket, uri, auth_token)
+                            return _local_ai_result(data, uri, env_uri, candidates, errors_by_uri)
+                        await websocket.close()
+                        last_error = "Invalid response type"
+                    except Exception as e:
+                        last_error = f"{type(e).__name__}: {str(e)}"
+                        errors_by_uri[uri] = last_error
+                        continue
 
             # Prefer an actionable error for the configured URL (if set),
             # otherwise for localhost (most common on host-network installs).
@@ -1318,7 +1699,6 @@ async def get_system_health():
 
     async def check_ai_engine():
         try:
-            import httpx
             env_url = (_dotenv_value("HEALTH_CHECK_AI_ENGINE_URL") or "").strip()
             if not env_url:
                 env_url = (os.getenv("HEALTH_CHECK_AI_ENGINE_URL") or "").strip()
@@ -1330,36 +1710,35 @@ async def get_system_health():
                 "http://host.docker.internal:15000/health",
             ])
 
-            timeout = httpx.Timeout(5.0, connect=1.5)
             last_error: Optional[str] = None
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                for url in candidates:
-                    logger.debug("Checking AI Engine at %s", url)
-                    try:
-                        resp = await client.get(url)
-                        logger.debug("AI Engine response: %s", resp.status_code)
-                        if resp.status_code == 200:
-                            warning = None
-                            if env_url and url != env_url:
-                                warning = (
-                                    f"HEALTH_CHECK_AI_ENGINE_URL is set but unreachable ({env_url}); "
-                                    f"connected via fallback ({url})."
-                                )
-                            return {
-                                "status": "connected",
-                                "details": resp.json(),
-                                "probe": {
-                                    "selected": url,
-                                    "attempted": candidates,
-                                }
-                                ,
-                                "warning": warning,
+            client = _get_health_http_client()
+            for url in candidates:
+                logger.debug("Checking AI Engine at %s", url)
+                try:
+                    resp = await client.get(url)
+                    logger.debug("AI Engine response: %s", resp.status_code)
+                    if resp.status_code == 200:
+                        warning = None
+                        if env_url and url != env_url:
+                            warning = (
+                                f"HEALTH_CHECK_AI_ENGINE_URL is set but unreachable ({env_url}); "
+                                f"connected via fallback ({url})."
+                            )
+                        return {
+                            "status": "connected",
+                            "details": resp.json(),
+                            "probe": {
+                                "selected": url,
+                                "attempted": candidates,
                             }
-                        last_error = f"HTTP {resp.status_code}"
-                    except Exception as e:
-                        last_error = f"{type(e).__name__}: {str(e)}"
-                        continue
+                            ,
+                            "warning": warning,
+                        }
+                    last_error = f"HTTP {resp.status_code}"
+                except Exception as e:
+                    last_error = f"{type(e).__name__}: {str(e)}"
+                    continue
 
             return {
                 "status": "error",
@@ -1377,7 +1756,6 @@ async def get_system_health():
                 "details": {"error": f"{type(e).__name__}: {str(e)}"},
             }
 
-    import asyncio
     local_ai, ai_engine = await asyncio.gather(check_local_ai(), check_ai_engine())
 
     return {
@@ -1395,24 +1773,24 @@ async def get_active_sessions():
     import httpx
     
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            for url in [
-                "http://127.0.0.1:15000/sessions/stats",
-                "http://ai_engine:15000/sessions/stats",
-                "http://ai-engine:15000/sessions/stats",
-            ]:
-                try:
-                    resp = await client.get(url)
-                    if resp.status_code != 200:
-                        continue
-                    data = resp.json()
-                    return {
-                        "active_calls": data.get("active_calls", 0),
-                        "sessions": data.get("sessions", []),
-                        "reachable": True,
-                    }
-                except httpx.ConnectError:
+        client = _get_health_http_client()
+        for url in [
+            "http://127.0.0.1:15000/sessions/stats",
+            "http://ai_engine:15000/sessions/stats",
+            "http://ai-engine:15000/sessions/stats",
+        ]:
+            try:
+                resp = await client.get(url)
+                if resp.status_code != 200:
                     continue
+                data = resp.json()
+                return {
+                    "active_calls": data.get("active_calls", 0),
+                    "sessions": data.get("sessions", []),
+                    "reachable": True,
+                }
+            except httpx.ConnectError:
+                continue
     except Exception as e:
         logger.debug("Could not fetch active sessions: %s", e)
     
@@ -1420,20 +1798,43 @@ async def get_active_sessions():
 
 
 @router.get("/directories")
-async def get_directory_health():
+async def get_directory_health(deep_check: bool = False):
     """
     Check health of directories required for audio playback.
     Returns status of media directory, symlink, and permissions.
+
+    Writability is checked with access(2); pass deep_check=true to create and
+    remove a probe file instead (for ACL/NFS setups where mode bits mislead).
     """
-    project_root = os.getenv("PROJECT_ROOT", "/app/project")
+    # Filesystem probes can stall on network mounts; keep them off the event loop.
+    return await asyncio.to_thread(_run_directory_checks, deep_check)
+
+
+# Media paths used by the /directories checks and fixes; fixed for the life of the container.
+_PROJECT_ROOT = os.getenv("PROJECT_ROOT", "/app/project")
+_HOST_MEDIA_ROOT = os.path.join(_PROJECT_ROOT, "asterisk_media")
+_HOST_MEDIA_DIR = os.path.join(_HOST_MEDIA_ROOT, "ai-generated")
+_ASTERISK_SOUNDS_LINK = "/var/lib/asterisk/sounds/ai-generated"
+_CONTAINER_MEDIA_DIR = "/mnt/asterisk_media/ai-generated"
+
+
+def _lstat_or_none(path: str) -> Optional[os.stat_result]:
+    """Single lstat() probe; None if the path is missing or unreadable (like os.path.lexists)."""
+    try:
+        return os.lstat(path)
+    except OSError:
+        return None
+
+
+def _run_directory_checks(deep_check: bool = False) -> dict:
     ast_media_dir = os.getenv("AST_MEDIA_DIR", "")
-    in_docker = bool(os.path.exists("/.dockerenv") or os.getenv("DOCKER_CONTAINER", ""))
+    in_docker = bool(_IN_CONTAINER or os.getenv("DOCKER_CONTAINER", ""))
     
     # Expected paths
-    host_media_root = os.path.join(project_root, "asterisk_media")
-    host_media_dir = os.path.join(project_root, "asterisk_media", "ai-generated")
-    asterisk_sounds_link = "/var/lib/asterisk/sounds/ai-generated"
-    container_media_dir = "/mnt/asterisk_media/ai-generated"
+    host_media_root = _HOST_MEDIA_ROOT
+    host_media_dir = _HOST_MEDIA_DIR
+    asterisk_sounds_link = _ASTERISK_SOUNDS_LINK
+    container_media_dir = _CONTAINER_MEDIA_DIR
     
     checks = {
         "media_dir_configured": {
@@ -1479,7 +1880,8 @@ async def get_directory_health():
     # Check 2: Host directory exists and is writable
     try:
         broken_media_root = False
-        if os.path.islink(host_media_root):
+        media_root_st = _lstat_or_none(host_media_root)
+        if media_root_st is not None and stat.S_ISLNK(media_root_st.st_mode):
             checks["host_directory"]["media_root_is_symlink"] = True
             try:
                 checks["host_directory"]["media_root_symlink_target"] = os.readlink(host_media_root)
@@ -1513,16 +1915,23 @@ async def get_directory_health():
         if not broken_media_root and os.path.exists(path_to_check):
             checks["host_directory"]["exists"] = True
             # Test write permission
-            test_file = os.path.join(path_to_check, ".write_test")
-            try:
-                with open(test_file, "w") as f:
-                    f.write("test")
-                os.remove(test_file)
+            if deep_check:
+                test_file = os.path.join(path_to_check, ".write_test")
+                try:
+                    with open(test_file, "w") as f:
+                        f.write("test")
+                    os.remove(test_file)
+                    writable = True
+                except PermissionError:
+                    writable = False
+            else:
+                writable = os.access(path_to_check, os.W_OK)
+            if writable:
                 checks["host_directory"]["writable"] = True
                 if checks["host_directory"]["status"] != "warning":
                     checks["host_directory"]["status"] = "ok"
                     checks["host_directory"]["message"] = "Directory exists and is writable"
-            except PermissionError:
+            else:
                 checks["host_directory"]["status"] = "error"
                 checks["host_directory"]["message"] = "Directory exists but not writable"
         elif not broken_media_root:
@@ -1540,7 +1949,8 @@ async def get_directory_health():
     # /var/lib/asterisk/sounds is on the host and not mounted into the container.
     # If the other checks pass, assume symlink is OK (user can verify with test call).
     try:
-        if os.path.islink(asterisk_sounds_link):
+        link_st = _lstat_or_none(asterisk_sounds_link)
+        if link_st is not None and stat.S_ISLNK(link_st.st_mode):
             checks["asterisk_symlink"]["exists"] = True
             target = os.readlink(asterisk_sounds_link)
             checks["asterisk_symlink"]["target"] = target
@@ -1553,7 +1963,7 @@ async def get_directory_health():
             else:
                 checks["asterisk_symlink"]["status"] = "warning"
                 checks["asterisk_symlink"]["message"] = f"Symlink points to {target}, expected {host_media_dir}"
-        elif os.path.exists(asterisk_sounds_link):
+        elif link_st is not None:
             checks["asterisk_symlink"]["exists"] = True
             # If running on host and it's a mount point, treat as OK (bind mount mode).
             if not in_docker and os.path.ismount(asterisk_sounds_link):
@@ -1575,11 +1985,11 @@ async def get_directory_health():
         checks["asterisk_symlink"]["status"] = "error"
         checks["asterisk_symlink"]["message"] = f"Error checking symlink: {str(e)}"
     
-    # Calculate overall health
-    statuses = [c["status"] for c in checks.values()]
-    if all(s == "ok" for s in statuses):
+    # Calculate overall health (single pass over the checks)
+    statuses = {c["status"] for c in checks.values()}
+    if statuses == {"ok"}:
         overall = "healthy"
-    elif any(s == "error" for s in statuses):
+    elif "error" in statuses:
         overall = "error"
     else:
         overall = "warning"
@@ -1596,13 +2006,16 @@ async def fix_directory_issues():
     Attempt to fix directory permission and symlink issues.
     Note: Symlink creation requires host access - use preflight.sh for that.
     """
-    import subprocess
-    
-    project_root = os.getenv("PROJECT_ROOT", "/app/project")
-    host_media_root = os.path.join(project_root, "asterisk_media")
-    host_media_dir = os.path.join(project_root, "asterisk_media", "ai-generated")
-    asterisk_sounds_link = "/var/lib/asterisk/sounds/ai-generated"
-    in_docker = bool(os.path.exists("/.dockerenv") or os.getenv("DOCKER_CONTAINER", ""))
+    # Filesystem fixes and the host-side Docker run all block; keep them off the event loop.
+    return await asyncio.to_thread(_apply_directory_fixes)
+
+
+def _apply_directory_fixes() -> dict:
+    project_root = _PROJECT_ROOT
+    host_media_root = _HOST_MEDIA_ROOT
+    host_media_dir = _HOST_MEDIA_DIR
+    asterisk_sounds_link = _ASTERISK_SOUNDS_LINK
+    in_docker = bool(_IN_CONTAINER or os.getenv("DOCKER_CONTAINER", ""))
     
     fixes_applied = []
     errors = []
@@ -1617,7 +2030,7 @@ async def fix_directory_issues():
         desired_gid = 995
     desired_uid = 1000
 
-    path_to_fix = "/mnt/asterisk_media/ai-generated" if in_docker else host_media_dir
+    path_to_fix = _CONTAINER_MEDIA_DIR if in_docker else host_media_dir
     
     # If asterisk_media is a symlink to a missing target (common after reboot with external mounts),
     # auto-fix inside the container cannot repair it.
@@ -1654,7 +2067,7 @@ async def fix_directory_issues():
     # This avoids discrepancies between container-visible paths and host bind-mount resolution.
     if in_docker:
         try:
-            client = docker.from_env()
+            client = _get_docker_client()
             container = client.containers.get("admin_ui")
             mounts = container.attrs.get("Mounts", []) or []
             host_project_path = None
@@ -1710,29 +2123,37 @@ echo "media permissions fixed"
     else:
         # Running on host - can create symlink directly
         try:
-            if os.path.islink(asterisk_sounds_link):
+            link_st = _lstat_or_none(asterisk_sounds_link)
+            if link_st is not None and stat.S_ISLNK(link_st.st_mode):
                 os.unlink(asterisk_sounds_link)
                 fixes_applied.append(f"Removed old symlink: {asterisk_sounds_link}")
-            elif os.path.exists(asterisk_sounds_link):
+                link_st = None
+            elif link_st is not None:
                 errors.append(f"Cannot fix: {asterisk_sounds_link} exists and is not a symlink")
             
-            if not os.path.exists(asterisk_sounds_link):
+            if link_st is None:
                 os.symlink(host_media_dir, asterisk_sounds_link)
                 fixes_applied.append(f"Created symlink: {asterisk_sounds_link} → {host_media_dir}")
         except PermissionError:
-            try:
-                result = subprocess.run(
-                    ["sudo", "ln", "-sf", host_media_dir, asterisk_sounds_link],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if result.returncode == 0:
-                    fixes_applied.append(f"Created symlink with sudo: {asterisk_sounds_link} → {host_media_dir}")
-                else:
-                    errors.append(f"Failed to create symlink with sudo: {result.stderr}")
-            except Exception as e:
-                errors.append(f"Failed to create symlink: {str(e)}")
+            # The in-process os.symlink failed; only fork sudo when it exists and can
+            # run without a password prompt (-n fails fast instead of waiting out the timeout).
+            if shutil.which("sudo") is None:
+                errors.append(f"Permission denied creating {asterisk_sounds_link} (sudo not available)")
+                manual_steps.append(f"Run on host: sudo ln -sf {host_media_dir} {asterisk_sounds_link}")
+            else:
+                try:
+                    result = subprocess.run(
+                        ["sudo", "-n", "ln", "-sf", host_media_dir, asterisk_sounds_link],
+                        capture_output=True,
+                        text=True,
+                        timeout=10
+                    )
+                    if result.returncode == 0:
+                        fixes_applied.append(f"Created symlink with sudo: {asterisk_sounds_link} → {host_media_dir}")
+                    else:
+                        errors.append(f"Failed to create symlink with sudo: {result.stderr}")
+                except Exception as e:
+                    errors.append(f"Failed to create symlink: {str(e)}")
         except Exception as e:
             errors.append(f"Failed to manage symlink: {str(e)}")
     
@@ -1980,15 +2401,33 @@ def _select_platform_key(platforms: Optional[dict], os_id: str, os_family: str)
     return None
 
 
+_OS_FAMILY_MAP = MappingProxyType({
+    "ubuntu": "debian",
+    "debian": "debian",
+    "linuxmint": "debian",
+    "centos": "rhel",
+    "rhel": "rhel",
+    "rocky": "rhel",
+    "almalinux": "rhel",
+    "fedora": "rhel",
+})
+_EOL_VERSIONS = MappingProxyType({
+    "ubuntu": frozenset({"18.04", "20.04"}),
+    "debian": frozenset({"9", "10"}),
+    "centos": frozenset({"7", "8"}),
+})
+
+
+@functools.lru_cache(maxsize=1)
 def _detect_os():
-    """Detect OS from /etc/os-release or container environment."""
+    """Detect OS from /etc/os-release or container environment (cached; see _invalidate_platform_cache)."""
     os_info = {
         "id": "unknown",
         "version": "unknown", 
         "family": "unknown",
-        "arch": os.uname().machine,
+        "arch": _ARCH,
         "is_eol": False,
-        "in_container": os.path.exists("/.dockerenv")
+        "in_container": _IN_CONTAINER
     }
     
     # Try to read host OS info (mounted from host in docker-compose)
@@ -2001,27 +2440,19 @@ def _detect_os():
         if os.path.exists(path):
             try:
                 with open(path) as f:
-                    for line in f:
-                        if line.startswith("ID="):
-                            os_info["id"] = line.split("=")[1].strip().strip('"')
-                        elif line.startswith("VERSION_ID="):
-                            os_info["version"] = line.split("=")[1].strip().strip('"')
+                    # os-release is shell-compatible KEY=value; shlex handles quoting/escapes/comments.
+                    fields = dict(
+                        token.split("=", 1) for token in shlex.split(f.read(), comments=True) if "=" in token
+                    )
+                os_info["id"] = fields.get("ID", os_info["id"])
+                os_info["version"] = fields.get("VERSION_ID", os_info["version"])
                 
                 # Determine family
                 os_id = os_info["id"]
-                if os_id in ["ubuntu", "debian", "linuxmint"]:
-                    os_info["family"] = "debian"
-                elif os_id in ["centos", "rhel", "rocky", "almalinux", "fedora"]:
-                    os_info["family"] = "rhel"
+                os_info["family"] = _OS_FAMILY_MAP.get(os_id, "unknown")
                 
                 # Check EOL status
-                eol_versions = {
-                    "ubuntu": ["18.04", "20.04"],
-                    "debian": ["9", "10"],
-                    "centos": ["7", "8"]
-                }
-                if os_info["version"] in eol_versions.get(os_id, []):
-                    os_info["is_eol"] = True
+                os_info["is_eol"] = os_info["version"] in _EOL_VERSIONS.get(os_id, frozenset())
                 
                 break
             except Exception:
@@ -2030,6 +2461,29 @@ def _detect_os():
     return os_info
 
 
+# Engine version/info rarely change; reuse them across /platform hits for a short while.
+_DOCKER_ENGINE_META_TTL_SEC = 30.0
+_docker_engine_meta: Optional[Tuple[float, dict, Optional[dict]]] = None
+_docker_engine_meta_lock = threading.Lock()
+
+
+def _get_docker_engine_meta() -> Tuple[dict, Optional[dict]]:
+    """Return (client.version(), client.info() or None), cached for a short TTL. Errors are not cached."""
+    global _docker_engine_meta
+    with _docker_engine_meta_lock:
+        cached = _docker_engine_meta
+        if cached is not None and time.monotonic() - cached[0] < _DOCKER_ENGINE_META_TTL_SEC:
+            return cached[1], cached[2]
+        client = _get_docker_client()
+        version_info = client.version()
+        try:
+            info = client.info()
+        except Exception:
+            info = None
+        _docker_engine_meta = (time.monotonic(), version_info, info)
+        return version_info, info
+
+
 def _detect_docker():
     """Detect Docker version and mode."""
     sock_path = "/var/run/docker.sock"
@@ -2066,8 +2520,7 @@ def _detect_docker():
             pass
     
     try:
-        client = docker.from_env()
-        version_info = client.version()
+        version_info, info = _get_docker_engine_meta()
         docker_info["installed"] = True
         docker_info["reachable"] = True
         docker_info["version"] = version_info.get("Version", "unknown")
@@ -2077,7 +2530,6 @@ def _detect_docker():
 
         # Docker Desktop / Engine metadata (helps Tier-3 messaging)
         try:
-            info = client.info()
             operating_system = info.get("OperatingSystem") or ""
             docker_info["operating_system"] = operating_system or None
             docker_info["engine_arch"] = info.get("Architecture") or None
@@ -2122,8 +2574,24 @@ def _detect_docker():
     return docker_info
 
 
+# Last successful _detect_compose() result; failures are re-probed on the next call.
+_compose_result: Optional[dict] = None
+_compose_lock = threading.Lock()
+
+
 def _detect_compose():
-    """Detect Docker Compose version."""
+    """Detect Docker Compose version (cached once detected; see _invalidate_platform_cache)."""
+    global _compose_result
+    with _compose_lock:
+        if _compose_result is None:
+            compose_info = _probe_compose()
+            if not compose_info["installed"]:
+                return compose_info
+            _compose_result = compose_info
+        return _compose_result
+
+
+def _probe_compose():
     import subprocess
     
     compose_info = {
@@ -2174,10 +2642,11 @@ def _detect_compose():
     #
     # Note: this reflects the Compose version used to create/recreate the current stack.
     try:
-        client = docker.from_env()
+        client = _get_docker_client()
         versions = []
-        for container in client.containers.list():
-            labels = container.labels or {}
+        # Server-side label filter + sparse list entries: no per-container inspect.
+        for entry in client.api.containers(filters={"label": "com.docker.compose.version"}):
+            labels = entry.get("Labels") or {}
             v = (labels.get("com.docker.compose.version") or "").strip().lstrip("v")
             if v:
                 versions.append(v)
@@ -2237,8 +2706,79 @@ def _detect_compose():
     return compose_info
 
 
+# Host tool probes used by SELinux/Asterisk detection, run together in one shell.
+# "$t" expands to a per-tool `timeout` prefix so one hung tool can't eat the others' budget.
+_HOST_TOOL_COMMANDS = MappingProxyType({
+    "getenforce": "$t getenforce",
+    "semanage": "command -v semanage",
+    "asterisk": "$t asterisk -V",
+    "fwconsole": "$t fwconsole -V",
+})
+_HOST_TOOL_TIMEOUT_S = 5
+_TIMEOUT_EXIT_CODE = 124
+_host_tools_lock = threading.Lock()
+_host_tools_result: Optional[Dict[str, Tuple[int, str]]] = None
+
+
+_ASTERISK_CONFIG_PATHS = (
+    ("/etc/asterisk", "/etc/asterisk/asterisk.conf"),
+    ("/usr/local/etc/asterisk", "/usr/local/etc/asterisk/asterisk.conf"),
+)
+_FREEPBX_MARKERS = ("/etc/freepbx.conf", "/etc/sangoma/pbx")
+
+
+def _freepbx_present() -> bool:
+    return any(os.path.exists(path) for path in _FREEPBX_MARKERS)
+
+
+def _run_host_tool_probes() -> Tuple[Dict[str, Tuple[int, str]], bool]:
+    """Run the host tool probes; returns (results, complete). Incomplete results must not be cached."""
+    names = ["asterisk"]
+    if os.path.exists("/sys/fs/selinux"):
+        names[:0] = ["getenforce", "semanage"]
+    if _freepbx_present():
+        names.append("fwconsole")
+    # One fork for all probes: each emits "<exit code>\0<stdout>\0".
+    script = f"t=; command -v timeout >/dev/null 2>&1 && t='timeout {_HOST_TOOL_TIMEOUT_S}'; " + "; ".join(
+        f"out=$({_HOST_TOOL_COMMANDS[name]} 2>/dev/null); rc=$?; printf '%s\\0%s\\0' \"$rc\" \"$out\""
+        for name in names
+    )
+    try:
+        proc = subprocess.run(
+            ["sh", "-c", script],
+            capture_output=True,
+            text=True,
+            # Backstop for hosts without coreutils `timeout`.
+            timeout=_HOST_TOOL_TIMEOUT_S * len(names) + 1,
+        )
+    except Exception:
+        logger.debug("Host tool probe failed", exc_info=True)
+        return {}, False
+    parts = proc.stdout.split("\0")
+    results: Dict[str, Tuple[int, str]] = {}
+    for i, name in enumerate(names):
+        try:
+            results[name] = (int(parts[2 * i]), parts[2 * i + 1])
+        except (IndexError, ValueError):
+            return results, False
+    complete = all(rc != _TIMEOUT_EXIT_CODE for rc, _ in results.values())
+    return results, complete
+
+
+def _probe_host_tools() -> Dict[str, Tuple[int, str]]:
+    """Exit code and stdout of getenforce/semanage/asterisk/fwconsole (cached once complete; probed at most once concurrently)."""
+    global _host_tools_result
+    with _host_tools_lock:
+        if _host_tools_result is None:
+            results, complete = _run_host_tool_probes()
+            if not complete:
+                return results
+            _host_tools_result = results
+        return _host_tools_result
+
+
 def _detect_selinux():
-    """Detect SELinux status."""
+    """Detect SELinux status (host tool output is cached by _probe_host_tools)."""
     selinux_info = {
         "present": False,
         "mode": None,
@@ -2259,30 +2799,24 @@ def _detect_selinux():
         except Exception:
             pass
         
+        host_tools = _probe_host_tools()
+
         # Get mode
-        try:
-            import subprocess
-            result = subprocess.run(["getenforce"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                selinux_info["mode"] = result.stdout.strip().lower()
-        except:
-            pass
+        rc, out = host_tools.get("getenforce", (None, ""))
+        if rc == 0:
+            selinux_info["mode"] = out.strip().lower()
         
         # Check if semanage is available
-        try:
-            import subprocess
-            result = subprocess.run(["which", "semanage"], capture_output=True, timeout=5)
-            selinux_info["tools_installed"] = result.returncode == 0
-        except:
-            pass
+        rc, _ = host_tools.get("semanage", (None, ""))
+        selinux_info["tools_installed"] = rc == 0
     
     return selinux_info
 
 
 def _detect_directories():
-    """Check required directories."""
+    """Check required directories (not cached: POST /directories/fix and the host change them)."""
     media_dir = os.environ.get("AST_MEDIA_DIR", "/mnt/asterisk_media/ai-generated")
-    in_container = os.path.exists("/.dockerenv")
+    in_container = _IN_CONTAINER
     
     # When running in container, check if media dir is mounted
     # The path inside container may differ from host path
@@ -2295,7 +2829,8 @@ def _detect_directories():
     writable = False
     actual_path = media_dir
     
-    for path in paths_to_check:
+    # The candidates often coincide (AST_MEDIA_DIR at its default); probe each path once.
+    for path in dict.fromkeys(paths_to_check):
         if os.path.exists(path):
             exists = True
             writable = os.access(path, os.W_OK)
@@ -2305,11 +2840,13 @@ def _detect_directories():
     # If in container and no local path found, check via Docker client
     if in_container and not exists:
         try:
-            client = docker.from_env()
+            client = _get_docker_client()
             # Check if there's a volume mount for media
-            for container in client.containers.list():
-                if container.name in ["ai_engine", "admin_ui"]:
-                    mounts = container.attrs.get("Mounts", [])
+            entries = client.api.containers(filters={"name": ["^/ai_engine$", "^/admin_ui$"]})
+            for entry in entries:
+                names = [n.lstrip("/") for n in (entry.get("Names") or [])]
+                if "ai_engine" in names or "admin_ui" in names:
+                    mounts = entry.get("Mounts") or []
                     for mount in mounts:
                         if "asterisk_media" in mount.get("Source", "") or "ai-generated" in mount.get("Source", ""):
                             # Volume is mounted on host
@@ -2334,7 +2871,7 @@ def _detect_directories():
 
 
 def _detect_asterisk():
-    """Detect Asterisk installation."""
+    """Detect Asterisk installation (host tool output is cached by _probe_host_tools)."""
     asterisk_info = {
         "detected": False,
         "version": None,
@@ -2345,63 +2882,54 @@ def _detect_asterisk():
         }
     }
     
-    # Check common paths
-    asterisk_paths = ["/etc/asterisk", "/usr/local/etc/asterisk"]
-    for path in asterisk_paths:
-        if os.path.exists(path) and os.path.exists(os.path.join(path, "asterisk.conf")):
+    # Check common paths (one stat per candidate: asterisk.conf implies its directory)
+    for path, conf_path in _ASTERISK_CONFIG_PATHS:
+        if os.path.isfile(conf_path):
             asterisk_info["detected"] = True
             asterisk_info["config_dir"] = path
             break
     
+    host_tools = _probe_host_tools()
+
     # Check for Asterisk binary
-    try:
-        import subprocess
-        result = subprocess.run(["asterisk", "-V"], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            asterisk_info["version"] = result.stdout.strip()
-    except:
-        pass
+    rc, out = host_tools.get("asterisk", (None, ""))
+    if rc == 0:
+        asterisk_info["version"] = out.strip()
     
     # Check for FreePBX
-    if os.path.exists("/etc/freepbx.conf") or os.path.exists("/etc/sangoma/pbx"):
+    if _freepbx_present():
         asterisk_info["freepbx"]["detected"] = True
-        try:
-            import subprocess
-            result = subprocess.run(["fwconsole", "-V"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                asterisk_info["freepbx"]["version"] = result.stdout.strip()
-        except:
-            pass
+        rc, out = host_tools.get("fwconsole", (None, ""))
+        if rc == 0:
+            asterisk_info["freepbx"]["version"] = out.strip()
     
     return asterisk_info
 
 
-def _check_port(port: int, is_own_port: bool = False) -> dict:
-    """Check if a port is in use and by what."""
-    import socket
-    
-    result = {
-        "port": port,
-        "in_use": False,
-        "is_own_port": is_own_port,
-        "status": "ok"
-    }
-    
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
-            connect_result = s.connect_ex(('localhost', port))
-            result["in_use"] = (connect_result == 0)
-    except:
-        pass
-    
-    # If it's our own port (admin-ui on 3003), it's expected to be in use
-    if is_own_port and result["in_use"]:
-        result["status"] = "ok"  # Expected
-    elif result["in_use"]:
-        result["status"] = "warning"
-    
-    return result
+def _invalidate_platform_cache() -> None:
+    """Drop cached platform detection (OS, host tools, Docker engine/Compose) so the next /platform re-probes."""
+    global _docker_engine_meta, _host_tools_result, _compose_result
+    _detect_os.cache_clear()
+    _compose_result = None
+    _host_tools_result = None
+    _docker_engine_meta = None
+
+
+# Static "ok" checks (the common case), built once.
+_ARCH_OK_CHECK = MappingProxyType({
+    "id": "architecture",
+    "status": "ok",
+    "message": "Architecture: x86_64",
+    "blocking": False,
+    "action": None,
+})
+_PORT_3003_OK_CHECK = MappingProxyType({
+    "id": "port_3003",
+    "status": "ok",
+    "message": "Admin UI port 3003 active",
+    "blocking": False,
+    "action": None,
+})
 
 
 def _build_checks(os_info, docker_info, compose_info, selinux_info, dir_info, asterisk_info, platform_cfg: Optional[dict]) -> List[dict]:
@@ -2431,13 +2959,7 @@ def _build_checks(os_info, docker_info, compose_info, selinux_info, dir_info, as
                 "action": None
             })
     else:
-        checks.append({
-            "id": "architecture",
-            "status": "ok",
-            "message": f"Architecture: {os_info['arch']}",
-            "blocking": False,
-            "action": None
-        })
+        checks.append(dict(_ARCH_OK_CHECK))
 
     # Tier 3 note (Docker Desktop): common source of confusion is "running but not reachable" due to networking differences.
     if docker_info.get("is_docker_desktop"):
@@ -2694,18 +3216,9 @@ def _build_checks(os_info, docker_info, compose_info, selinux_info, dir_info, as
             "action": None
         })
     
-    # Port check - port 3003 is admin-ui's own port, so it's expected to be in use
-    port_check = _check_port(3003, is_own_port=True)
-    # Only show port check if it's NOT in use (which would be unexpected for admin-ui)
-    # or skip entirely since this is admin-ui's port
-    # We'll show a success message instead
-    checks.append({
-        "id": "port_3003",
-        "status": "ok",
-        "message": "Admin UI port 3003 active",
-        "blocking": False,
-        "action": None
-    })
+    # Port check - port 3003 is admin-ui's own port, so it is in use whenever this API answers.
+    # No probe needed; show a success message instead.
+    checks.append(dict(_PORT_3003_OK_CHECK))
     
     # Asterisk check
     if asterisk_info["detected"]:
@@ -2729,19 +3242,42 @@ def _build_checks(os_info, docker_info, compose_info, selinux_info, dir_info, as
 
 
 @router.get("/platform")
-async def get_platform():
+async def get_platform(request: Request):
     """
     Get platform detection and check results.
     AAVA-126: Cross-Platform Support
+
+    Sends an ETag; a matching If-None-Match gets 304 Not Modified with no body.
     """
-    os_info = _detect_os()
-    docker_info = _detect_docker()
-    compose_info = _detect_compose()
-    selinux_info = _detect_selinux()
-    dir_info = _detect_directories()
-    asterisk_info = _detect_asterisk()
+    body = orjson.dumps(await _platform_payload(), default=str, option=orjson.OPT_SORT_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _platform_payload() -> dict:
+    # The detectors are independent and block on subprocesses, files and the Docker
+    # API; run them side by side so the response waits only for the slowest probe.
     project_root = os.getenv("PROJECT_ROOT", "/app/project")
-    project_info = _detect_project_version(project_root)
+    (
+        os_info,
+        docker_info,
+        compose_info,
+        selinux_info,
+        dir_info,
+        asterisk_info,
+        project_info,
+    ) = await asyncio.gather(
+        asyncio.to_thread(_detect_os),
+        asyncio.to_thread(_detect_docker),
+        asyncio.to_thread(_detect_compose),
+        asyncio.to_thread(_detect_selinux),
+        asyncio.to_thread(_detect_directories),
+        asyncio.to_thread(_detect_asterisk),
+        asyncio.to_thread(_detect_project_version, project_root),
+    )
 
     platforms = _load_platforms_yaml()
     platform_key = _select_platform_key(platforms, os_info.get("id"), os_info.get("family"))
@@ -2780,14 +3316,15 @@ async def get_platform():
     }
 
 
-@router.post("/preflight")
+@router.post("/preflight", response_class=ORJSONResponse)
 async def run_preflight():
     """
     Re-run preflight checks and return fresh results.
     AAVA-126: Cross-Platform Support
     """
-    # Same as GET /platform but explicitly named for clarity
-    return await get_platform()
+    # Same as GET /platform, but re-probes the host instead of using cached detection.
+    _invalidate_platform_cache()
+    return await _platform_payload()
 
 
 class ContainerAction(BaseModel):
@@ -2797,18 +3334,17 @@ class ContainerAction(BaseModel):
 @router.post("/containers/start")
 async def start_containers(action: ContainerAction = None):
     """Start containers."""
-    import subprocess
     project_root = os.getenv("PROJECT_ROOT", "/app/project")
     
-    cmd = ["docker", "compose", "up", "-d"]
+    cmd = [_DOCKER_BIN, "compose", "up", "-d"]
     if action and action.containers:
         cmd.extend(action.containers)
     
     try:
-        result = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True, timeout=120)
+        returncode, stdout, stderr = await _run_subprocess(cmd, cwd=project_root, timeout_sec=120)
         return {
-            "success": result.returncode == 0,
-            "output": result.stdout or result.stderr
+            "success": returncode == 0,
+            "output": stdout or stderr
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2817,18 +3353,17 @@ async def start_containers(action: ContainerAction = None):
 @router.post("/containers/stop")
 async def stop_containers(action: ContainerAction = None):
     """Stop containers."""
-    import subprocess
     project_root = os.getenv("PROJECT_ROOT", "/app/project")
     
-    cmd = ["docker", "compose", "stop"]
+    cmd = [_DOCKER_BIN, "compose", "stop"]
     if action and action.containers:
         cmd.extend(action.containers)
     
     try:
-        result = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True, timeout=120)
+        returncode, stdout, stderr = await _run_subprocess(cmd, cwd=project_root, timeout_sec=120)
         return {
-            "success": result.returncode == 0,
-            "output": result.stdout or result.stderr
+            "success": returncode == 0,
+            "output": stdout or stderr
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2837,17 +3372,16 @@ async def stop_containers(action: ContainerAction = None):
 @router.post("/containers/restart-all")
 async def restart_all_containers():
     """Restart all containers."""
-    import subprocess
     project_root = os.getenv("PROJECT_ROOT", "/app/project")
     
     try:
         # Stop
-        subprocess.run(["docker", "compose", "stop"], cwd=project_root, timeout=60)
+        await _run_subprocess([_DOCKER_BIN, "compose", "stop"], cwd=project_root, timeout_sec=60)
         # Start
-        result = subprocess.run(["docker", "compose", "up", "-d"], cwd=project_root, capture_output=True, text=True, timeout=120)
+        returncode, stdout, stderr = await _run_subprocess([_DOCKER_BIN, "compose", "up", "-d"], cwd=project_root, timeout_sec=120)
         return {
-            "success": result.returncode == 0,
-            "output": result.stdout or result.stderr
+            "success": returncode == 0,
+            "output": stdout or stderr
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2982,35 +3516,35 @@ async def test_ari_connection(request: AriTestRequest):
         # Configure SSL verification (disable for self-signed certs)
         verify = request.ssl_verify if request.scheme == "https" else True
         
-        async with httpx.AsyncClient(timeout=10.0, verify=verify) as client:
-            response = await client.get(
-                ari_url,
-                auth=(request.username, request.password)
-            )
+        client = _get_ari_http_client(bool(verify))
+        response = await client.get(
+            ari_url,
+            auth=(request.username, request.password)
+        )
             
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "message": "Successfully connected to Asterisk ARI",
-                    "asterisk_version": data.get("system", {}).get("version", "Unknown"),
-                    "build": data.get("build", {})
-                }
-            elif response.status_code == 401:
-                return {
-                    "success": False,
-                    "error": "Authentication failed - check username and password"
-                }
-            elif response.status_code == 403:
-                return {
-                    "success": False,
-                    "error": "Access forbidden - check ARI user permissions"
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unexpected response: HTTP {response.status_code}"
-                }
+        if response.status_code == 200:
+            data = response.json()
+            return {
+                "success": True,
+                "message": "Successfully connected to Asterisk ARI",
+                "asterisk_version": data.get("system", {}).get("version", "Unknown"),
+                "build": data.get("build", {})
+            }
+        elif response.status_code == 401:
+            return {
+                "success": False,
+                "error": "Authentication failed - check username and password"
+            }
+        elif response.status_code == 403:
+            return {
+                "success": False,
+                "error": "Access forbidden - check ARI user permissions"
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"Unexpected response: HTTP {response.status_code}"
+            }
                 
     except httpx.ConnectError as e:
         logger.debug("ARI connection error", exc_info=True)
@@ -3052,7 +3586,6 @@ async def ari_extension_status(key: str = "", device_state_tech: str = "auto", d
     check the current ARI device state (preferred) or endpoint state (fallback)
     for a configured internal extension.
     """
-    import httpx
     extension_key = (key or "").strip()
     settings = _ari_env_settings()
     if not settings.get("username") or not settings.get("password"):
@@ -3072,69 +3605,69 @@ async def ari_extension_status(key: str = "", device_state_tech: str = "auto", d
     verify = settings["ssl_verify"] if settings["scheme"] == "https" else True
     base = f"{settings['scheme']}://{settings['host']}:{settings['port']}/ari"
 
-    async with httpx.AsyncClient(timeout=8.0, verify=verify) as client:
-        if device_state_id:
-            try:
-                # Keep URL constant to avoid request-derived path construction.
-                resp = await client.get(f"{base}/deviceStates", auth=(settings["username"], settings["password"]))
-                if resp.status_code == 200:
-                    data = resp.json() or []
-                    if isinstance(data, list):
-                        match = next(
-                            (
-                                item
-                                for item in data
-                                if str((item or {}).get("name") or "") == device_state_id
-                            ),
-                            None,
+    client = _get_ari_http_client(bool(verify))
+    if device_state_id:
+        try:
+            # Keep URL constant to avoid request-derived path construction.
+            resp = await client.get(f"{base}/deviceStates", auth=(settings["username"], settings["password"]), timeout=8.0)
+            if resp.status_code == 200:
+                data = resp.json() or []
+                if isinstance(data, list):
+                    match = next(
+                        (
+                            item
+                            for item in data
+                            if str((item or {}).get("name") or "") == device_state_id
+                        ),
+                        None,
+                    )
+                    if isinstance(match, dict):
+                        state = str(match.get("state") or "")
+                        return AriExtensionStatusResponse(
+                            success=True,
+                            source="device_state",
+                            status=_classify_device_state(state),
+                            state=state,
+                            device_state_id=device_state_id,
+                            endpoint_tech=endpoint_tech,
+                            endpoint_resource=endpoint_resource,
                         )
-                        if isinstance(match, dict):
-                            state = str(match.get("state") or "")
-                            return AriExtensionStatusResponse(
-                                success=True,
-                                source="device_state",
-                                status=_classify_device_state(state),
-                                state=state,
-                                device_state_id=device_state_id,
-                                endpoint_tech=endpoint_tech,
-                                endpoint_resource=endpoint_resource,
-                            )
-            except Exception:
-                logger.debug("ARI device state query failed", exc_info=True)
+        except Exception:
+            logger.debug("ARI device state query failed", exc_info=True)
 
-        if endpoint_tech and endpoint_resource:
-            try:
-                # Keep URL constant to avoid request-derived path construction.
-                resp = await client.get(f"{base}/endpoints", auth=(settings["username"], settings["password"]))
-                if resp.status_code == 200:
-                    data = resp.json() or []
-                    if isinstance(data, list):
-                        match = next(
-                            (
-                                item
-                                for item in data
-                                if str((item or {}).get("technology") or "").upper() == endpoint_tech
-                                and str((item or {}).get("resource") or "") == endpoint_resource
-                            ),
-                            None,
+    if endpoint_tech and endpoint_resource:
+        try:
+            # Keep URL constant to avoid request-derived path construction.
+            resp = await client.get(f"{base}/endpoints", auth=(settings["username"], settings["password"]), timeout=8.0)
+            if resp.status_code == 200:
+                data = resp.json() or []
+                if isinstance(data, list):
+                    match = next(
+                        (
+                            item
+                            for item in data
+                            if str((item or {}).get("technology") or "").upper() == endpoint_tech
+                            and str((item or {}).get("resource") or "") == endpoint_resource
+                        ),
+                        None,
+                    )
+                    if isinstance(match, dict):
+                        state = str(match.get("state") or "")
+                        # Endpoint state is not "availability"; be conservative.
+                        status = "unknown"
+                        if state.strip().lower() in ("online", "reachable", "registered"):
+                            status = "available"
+                        return AriExtensionStatusResponse(
+                            success=True,
+                            source="endpoint",
+                            status=status,
+                            state=state,
+                            device_state_id=device_state_id,
+                            endpoint_tech=endpoint_tech,
+                            endpoint_resource=endpoint_resource,
                         )
-                        if isinstance(match, dict):
-                            state = str(match.get("state") or "")
-                            # Endpoint state is not "availability"; be conservative.
-                            status = "unknown"
-                            if state.strip().lower() in ("online", "reachable", "registered"):
-                                status = "available"
-                            return AriExtensionStatusResponse(
-                                success=True,
-                                source="endpoint",
-                                status=status,
-                                state=state,
-                                device_state_id=device_state_id,
-                                endpoint_tech=endpoint_tech,
-                                endpoint_resource=endpoint_resource,
-                            )
-            except Exception:
-                logger.debug("ARI endpoint query failed", exc_info=True)
+        except Exception:
+            logger.debug("ARI endpoint query failed", exc_info=True)
 
     return AriExtensionStatusResponse(
         success=False,
@@ -3213,7 +3746,7 @@ def _run_docker(args: list[str], *, cwd: Optional[str] = None, timeout_sec: int
         raise ValueError("invalid docker args")
     try:
         proc = subprocess.run(
-            ["docker", *args],
+            [_DOCKER_BIN, *args],
             cwd=cwd,
             capture_output=True,
             text=True,
@@ -3283,7 +3816,7 @@ def _project_host_root_from_admin_ui_container() -> str:
     candidates = [c for c in [explicit_name, "admin_ui", (os.getenv("HOSTNAME") or "").strip()] if c]
 
     try:
-        client = docker.from_env()
+        client = _get_docker_client()
 
         c = None
         last_err = None
@@ -3322,7 +3855,7 @@ def _docker_sock_host_path_from_admin_ui_container() -> str:
     candidates = [c for c in [explicit_name, "admin_ui", (os.getenv("HOSTNAME") or "").strip()] if c]
 
     try:
-        client = docker.from_env()
+        client = _get_docker_client()
 
         c = None
         last_err = None
@@ -3455,7 +3988,7 @@ def _ensure_updater_image_for_sha(host_project_root: str, tag: str) -> None:
                     detail=f"Invalid project root for updater build: {host_project_root!r}",
                 )
 
-            client = docker.from_env()
+            client = _get_docker_client()
             try:
                 client.images.get(tag)
                 return
@@ -3516,7 +4049,7 @@ def _ensure_updater_image_for_ref(host_project_root: str, local_tag: str, *, pre
     For stable release tag updates, prefer pulling a published updater image from GHCR,
     and retag it to the local tag used by updater jobs.
     """
-    client = docker.from_env()
+    client = _get_docker_client()
     try:
         client.images.get(local_tag)
         return
@@ -3545,6 +4078,37 @@ def _ensure_updater_image_for_ref(host_project_root: str, local_tag: str, *, pre
     _ensure_updater_image_for_sha(host_project_root, local_tag)
 
 
+def _stream_container_lines(container, on_line: Callable[[str], None], *, stderr: bool = True) -> None:
+    """
+    Follow a container's output until it exits, invoking on_line once per decoded line.
+
+    Docker log chunks are not line-aligned, so partial lines are carried over between chunks.
+    The stream is read on a client without a read timeout, so long silent steps don't cut it
+    short; callers bound the total time by stopping the container.
+    """
+    pending = b""
+    try:
+        stream = _get_docker_stream_client().api.logs(
+            container.id, stdout=True, stderr=stderr, stream=True, follow=True
+        )
+        for chunk in stream:
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                on_line(raw.decode("utf-8", errors="replace").rstrip("\r"))
+    except Exception as e:
+        logger.debug("Container log stream ended early for %s: %s", getattr(container, "name", "<unknown>"), e)
+    if pending:
+        on_line(pending.decode("utf-8", errors="replace").rstrip("\r"))
+
+
+def _kill_container_quietly(container) -> None:
+    try:
+        container.kill()
+    except Exception:
+        logger.debug("Failed to kill container %s", getattr(container, "name", "<unknown>"), exc_info=True)
+
+
 def _run_updater_ephemeral(
     host_project_root: str,
     *,
@@ -3554,11 +4118,14 @@ def _run_updater_ephemeral(
     capture_stderr: bool = True,
     prefer_pull_ref: Optional[str] = None,
     allow_build: bool = True,
+    on_line: Optional[Callable[[str], None]] = None,
 ) -> tuple[int, str]:
     """
     Run the updater image as a short-lived container and return (exit_code, stdout/stderr).
 
     If command is provided, we override the default entrypoint with bash -lc <command>.
+    If on_line is provided, container output is streamed to it line-by-line while the
+    container runs instead of being buffered, and the returned output is empty.
     """
     import uuid
 
@@ -3566,7 +4133,7 @@ def _run_updater_ephemeral(
     tag = _updater_image_tag_for_sha(sha)
     _ensure_updater_image_for_ref(host_project_root, tag, prefer_pull_ref=prefer_pull_ref, allow_build=allow_build)
 
-    client = docker.from_env()
+    client = _get_docker_client()
     name = f"aava-update-ephemeral-{uuid.uuid4().hex[:10]}"
 
     host_docker_sock = _docker_sock_host_path_from_admin_ui_container()
@@ -3608,8 +4175,19 @@ def _run_updater_ephemeral(
                 detach=True,
             )
 
+        if on_line is not None:
+            # The log stream has no read timeout; killing the container at the deadline ends it.
+            watchdog = threading.Timer(timeout_sec, _kill_container_quietly, args=(container,))
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                _stream_container_lines(container, on_line, stderr=capture_stderr)
+            finally:
+                watchdog.cancel()
         result = container.wait(timeout=timeout_sec)
         status = int((result or {}).get("StatusCode", 1))
+        if on_line is not None:
+            return status, ""
         logs = (container.logs(stdout=True, stderr=capture_stderr) or b"").decode("utf-8", errors="replace")
         return status, logs
     finally:
@@ -4152,7 +4730,7 @@ async def updates_run(body: UpdateRunRequest):
         # Best-effort only; the updater container will still manage state/logs.
         pass
 
-    client = docker.from_env()
+    client = _get_docker_client()
     name = f"aava-update-{job_id[:12]}"
 
     volumes = {
@@ -4273,7 +4851,7 @@ async def updates_rollback(body: UpdateRollbackRequest):
     except Exception:
         pass
 
-    client = docker.from_env()
+    client = _get_docker_client()
     name = f"aava-rollback-{job_id[:12]}"
 
     volumes = {
@@ -668,7 +668,7 @@ async def test_http_tool(request: TestHTTPRequest):
         raise HTTPException(status_code=400, detail=f"Unsupported HTTP method: {method}")
 
     # Make the HTTP request
-    start_time = time.time()
+    start_time = time.monotonic()
     timeout_seconds = request.timeout_ms / 1000.0
     
     try:
@@ -721,7 +721,7 @@ async def test_http_tool(request: TestHTTPRequest):
                 raise HTTPException(status_code=400, detail="Request failed: no response received")
             response_data.resolved_url = str(resp.url)
             
-            response_data.response_time_ms = (time.time() - start_time) * 1000
+            response_data.response_time_ms = (time.monotonic() - start_time) * 1000
             response_data.status_code = resp.status_code
             response_data.headers = dict(resp.headers)
             response_data.body_raw = resp.text[:10000]  # Limit response size
@@ -741,13 +741,13 @@ async def test_http_tool(request: TestHTTPRequest):
                 response_data.error = f"HTTP {resp.status_code}: {resp.reason_phrase}"
                 
     except httpx.TimeoutException:
-        response_data.response_time_ms = (time.time() - start_time) * 1000
+        response_data.response_time_ms = (time.monotonic() - start_time) * 1000
         response_data.error = f"Request timed out after {request.timeout_ms}ms"
     except httpx.ConnectError as e:
-        response_data.response_time_ms = (time.time() - start_time) * 1000
+        response_data.response_time_ms = (time.monotonic() - start_time) * 1000
         response_data.error = f"Connection failed: {e!s}"
     except Exception as e:
-        response_data.response_time_ms = (time.time() - start_time) * 1000
+        response_data.response_time_ms = (time.monotonic() - start_time) * 1000
         response_data.error = f"Request failed: {e!s}"
         logger.exception("HTTP tool test failed")
     
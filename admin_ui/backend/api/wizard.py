@@ -8,7 +8,9 @@ import os
 import yaml
 import subprocess
 import stat
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Deque, Dict, Any, Iterable, Iterator, Optional, List, Tuple
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
 from pathlib import PurePosixPath
 import hashlib
@@ -23,7 +25,7 @@ import zipfile
 
 logger = logging.getLogger(__name__)
 from settings import ENV_PATH, CONFIG_PATH, LOCAL_CONFIG_PATH, ensure_env_file, PROJECT_ROOT
-from services.fs import upsert_env_vars, atomic_write_text
+from services.fs import upsert_env_vars, atomic_write_text, snapshot_file
 from api.models_catalog import (
     get_full_catalog, get_models_by_language, get_available_languages,
     LANGUAGE_NAMES, REGION_NAMES, VOSK_STT_MODELS, SHERPA_STT_MODELS,
@@ -450,7 +452,7 @@ class DownloadJob:
     running: bool = True
     completed: bool = False
     error: Optional[str] = None
-    output: List[str] = field(default_factory=list)
+    output: Deque[str] = field(default_factory=lambda: deque(maxlen=200))
     progress: Dict[str, Any] = field(
         default_factory=lambda: {
             "bytes_downloaded": 0,
@@ -462,8 +464,12 @@ class DownloadJob:
             "current_file": "",
         }
     )
+    # Guards the mutable fields above; _download_jobs_lock only guards the registry.
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
 
+# `_download_jobs_lock` only serialises create/evict; lookups are single dict.get()
+# calls (atomic under the GIL) and each job's fields are guarded by its own `_lock`.
 _download_jobs: Dict[str, DownloadJob] = {}
 _download_jobs_lock = threading.Lock()
 _latest_download_job_id: Optional[str] = None
@@ -474,54 +480,68 @@ def _create_download_job(kind: str, *, current_file: str = "") -> DownloadJob:
     global _latest_download_job_id
     job_id = str(uuid.uuid4())
     job = DownloadJob(id=job_id, kind=kind)
-    job.progress["start_time"] = time.time()
+    job.progress["start_time"] = time.monotonic()
     job.progress["current_file"] = current_file
     with _download_jobs_lock:
         _download_jobs[job_id] = job
         _latest_download_job_id = job_id
-        if len(_download_jobs) > 25:
-            oldest = sorted(_download_jobs.values(), key=lambda j: j.created_at)[:-25]
-            for j in oldest:
-                _download_jobs.pop(j.id, None)
+        # Dicts keep insertion order, so the oldest jobs are at the front.
+        while len(_download_jobs) > 25:
+            _download_jobs.pop(next(iter(_download_jobs)))
     return job
 
 
 def _get_download_job(job_id: Optional[str]) -> Optional[DownloadJob]:
     """Return the requested job, or the most recent job if `job_id` is None."""
-    with _download_jobs_lock:
-        if job_id:
-            return _download_jobs.get(job_id)
-        if _latest_download_job_id:
-            return _download_jobs.get(_latest_download_job_id)
+    # Lock-free: the latest id is rebound as a whole and read once into a local, and
+    # an id evicted in between simply yields None.
+    lookup_id = job_id or _latest_download_job_id
+    if not lookup_id:
         return None
+    return _download_jobs.get(lookup_id)
 
 
 def _job_output(job_id: str, line: str) -> None:
-    """Append a log line to a download job (trims to a fixed buffer)."""
-    with _download_jobs_lock:
-        job = _download_jobs.get(job_id)
-        if not job:
-            return
-        job.output.append(str(line))
-        if len(job.output) > 200:
-            job.output = job.output[-200:]
+    """
+    Append a log line to a download job (the bounded deque drops the oldest).
+
+    `line` must already be a stripped str; it is stored as-is.
+    """
+    job = _download_jobs.get(job_id)
+    if not job:
+        return
+    with job._lock:
+        job.output.append(line)
+
+
+def _job_output_many(job_id: str, lines: Iterable[str]) -> None:
+    """Append several log lines to a download job under one lock acquisition."""
+    job = _download_jobs.get(job_id)
+    if not job:
+        return
+    with job._lock:
+        job.output.extend(lines)
+
+
+# Minimum spacing between progress updates from urlretrieve hooks (UI polls ~1/s).
+_PROGRESS_UPDATE_INTERVAL_SEC = 0.5
 
 
 def _job_set_progress(job_id: str, **updates: Any) -> None:
     """Update progress fields for an in-flight download job."""
-    with _download_jobs_lock:
-        job = _download_jobs.get(job_id)
-        if not job:
-            return
+    job = _download_jobs.get(job_id)
+    if not job:
+        return
+    with job._lock:
         job.progress.update(updates)
 
 
 def _job_finish(job_id: str, *, completed: bool, error: Optional[str] = None) -> None:
     """Mark a download job as finished (success or error)."""
-    with _download_jobs_lock:
-        job = _download_jobs.get(job_id)
-        if not job:
-            return
+    job = _download_jobs.get(job_id)
+    if not job:
+        return
+    with job._lock:
         job.running = False
         job.completed = bool(completed)
         job.error = error
@@ -977,9 +997,10 @@ async def start_engine(action: str = "start"):
         
         health_url = "http://127.0.0.1:15000/health"
         max_attempts = 30
-        for attempt in range(max_attempts):
-            try:
-                async with httpx.AsyncClient(timeout=2.0) as http_client:
+        # One client for the whole poll so the connection pool is reused across attempts.
+        async with httpx.AsyncClient(timeout=2.0) as http_client:
+            for attempt in range(max_attempts):
+                try:
                     resp = await http_client.get(health_url)
                     if resp.status_code == 200:
                         health_data = resp.json()
@@ -992,9 +1013,9 @@ async def start_engine(action: str = "start"):
                             "health": health_data,
                             "media_setup": media_setup
                         }
-            except Exception:
-                pass
-            await asyncio.sleep(1)
+                except Exception:
+                    pass
+                await asyncio.sleep(1)
         
         add_step("health_check", "warning", "Health check timed out but container is running")
         return {
@@ -1179,6 +1200,25 @@ async def detect_local_tier():
         return {"error": str(e)}
 
 
+def _iter_pipe_line_batches(fd: int, chunk_size: int = 65536) -> Iterator[List[str]]:
+    """
+    Yield the decoded lines completed by each chunk read from a binary pipe.
+
+    Treats \r, \n and \r\n as line breaks (like text-mode universal newlines) so
+    carriage-return progress updates still arrive as separate lines.
+    """
+    pending = b""
+    while True:
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n")
+        if lines:
+            yield [raw.decode("utf-8", "replace") for raw in lines]
+    if pending:
+        yield [pending.decode("utf-8", "replace")]
+
+
 @router.post("/local/download-models")
 async def download_local_models(tier: str = "auto"):
     """Start model download in background. Returns immediately."""
@@ -1204,13 +1244,11 @@ async def download_local_models(tier: str = "auto"):
                     cwd=PROJECT_ROOT,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1
                 )
 
-                for line in iter(process.stdout.readline, ''):
-                    if line:
-                        _job_output(job.id, line.strip())
+                with process.stdout:
+                    for lines in _iter_pipe_line_batches(process.stdout.fileno()):
+                        _job_output_many(job.id, [line.strip() for line in lines])
                 
                 process.wait()
                 if process.returncode != 0:
@@ -1253,20 +1291,22 @@ async def get_download_progress(job_id: Optional[str] = None):
             "current_file": "",
         }
 
-    return {
-        "job_id": job.id,
-        "running": job.running,
-        "completed": job.completed,
-        "error": job.error,
-        "output": job.output[-20:] if job.output else [],  # Last 20 lines
-        # Detailed progress info
-        "bytes_downloaded": job.progress.get("bytes_downloaded", 0),
-        "total_bytes": job.progress.get("total_bytes", 0),
-        "percent": job.progress.get("percent", 0),
-        "speed_bps": job.progress.get("speed_bps", 0),
-        "eta_seconds": job.progress.get("eta_seconds"),
-        "current_file": job.progress.get("current_file", "")
-    }
+    with job._lock:
+        return {
+            "job_id": job.id,
+            "running": job.running,
+            "completed": job.completed,
+            "error": job.error,
+            # Last 20 lines, walked from the right end so only those 20 are copied.
+            "output": list(islice(reversed(job.output), 20))[::-1],
+            # Detailed progress info
+            "bytes_downloaded": job.progress.get("bytes_downloaded", 0),
+            "total_bytes": job.progress.get("total_bytes", 0),
+            "percent": job.progress.get("percent", 0),
+            "speed_bps": job.progress.get("speed_bps", 0),
+            "eta_seconds": job.progress.get("eta_seconds"),
+            "current_file": job.progress.get("current_file", "")
+        }
 
 
 class SingleModelDownload(BaseModel):
@@ -1339,17 +1379,24 @@ async def download_single_model(request: SingleModelDownload):
             
             # Download to temp file
             temp_file = os.path.join(target_dir, f".{request.model_id}.{uuid.uuid4().hex}.download{ext}.part")
-            start_time = time.time()
+            start_time = time.monotonic()
             last_update_time = start_time
+            last_progress_time = 0.0
             
             def progress_hook(block_num, block_size, total_size):
-                nonlocal last_update_time
+                nonlocal last_update_time, last_progress_time
                 
                 bytes_downloaded = block_num * block_size
-                current_time = time.time()
+                current_time = time.monotonic()
                 elapsed = current_time - start_time
                 
-                if total_size > 0:
+                # urlretrieve calls this every 8 KiB block; throttle job updates (and their
+                # lock round-trips) to the poll cadence, but always publish the final block.
+                if total_size > 0 and (
+                    current_time - last_progress_time >= _PROGRESS_UPDATE_INTERVAL_SEC
+                    or bytes_downloaded >= total_size
+                ):
+                    last_progress_time = current_time
                     percent = min(100, (bytes_downloaded * 100) // total_size)
                     speed_bps = bytes_downloaded / elapsed if elapsed > 0 else 0
                     remaining_bytes = total_size - bytes_downloaded
@@ -1652,14 +1699,18 @@ async def download_selected_models(selection: ModelSelection):
 
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
 
-            start_time = time.time()
+            start_time = time.monotonic()
             last_update = start_time
+            last_progress = 0.0
 
             def report_progress(block_num, block_size, total_size):
-                nonlocal last_update
+                nonlocal last_update, last_progress
                 bytes_done = block_num * block_size
-                if total_size > 0:
-                    now = time.time()
+                if total_size <= 0:
+                    return
+                now = time.monotonic()
+                if now - last_progress >= _PROGRESS_UPDATE_INTERVAL_SEC or bytes_done >= total_size:
+                    last_progress = now
                     percent = int(min(100, (bytes_done * 100) // total_size))
                     elapsed = max(0.001, now - start_time)
                     speed_bps = int(bytes_done / elapsed)
@@ -2191,29 +2242,14 @@ async def start_local_ai_server():
 @router.get("/local/server-logs")
 async def get_local_server_logs():
     """Get local-ai-server container logs."""
-    import subprocess
-    
     try:
-        # Get recent logs for display
-        result = subprocess.run(
-            ["docker", "logs", "--tail", "30", "local_ai_server"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        logs = result.stdout or result.stderr
-        lines = logs.strip().split('\n') if logs else []
-        
-        # Check if server is ready by looking at ALL logs (not just tail)
-        # The startup message might be pushed out by connection logs
-        ready_result = subprocess.run(
-            ["docker", "logs", "local_ai_server"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        all_logs = (ready_result.stdout or "") + (ready_result.stderr or "")
+        # Read logs once through the Docker Engine API (no `docker logs` fork/exec per poll).
+        # The full history is needed for readiness: the startup message might be pushed out
+        # of the tail by connection logs.
+        client = docker.from_env()
+        container = client.containers.get("local_ai_server")
+        all_logs = (container.logs(stdout=True, stderr=True) or b"").decode("utf-8", errors="replace")
+        lines = all_logs.strip().split('\n') if all_logs.strip() else []
         
         # Check for ready indicators in full log history
         ready = "Enhanced Local AI Server started" in all_logs or \
@@ -2224,8 +2260,6 @@ async def get_local_server_logs():
             "logs": lines[-20:],
             "ready": ready
         }
-    except subprocess.TimeoutExpired:
-        return {"logs": [], "ready": False, "error": "Timeout getting logs"}
     except Exception as e:
         # Fallback: if container isn't created yet (e.g., still building), show the build/start log if present.
         try:
@@ -2233,9 +2267,11 @@ async def get_local_server_logs():
 
             log_path = os.path.join(os.getenv("PROJECT_ROOT", "/app/project"), "logs", "local_ai_server_start.log")
             if os.path.exists(log_path):
-                with open(log_path, "r") as f:
-                    tail = f.read().splitlines()[-50:]
-                return {"logs": tail[-20:], "ready": False, "error": str(e)}
+                # Build logs grow large; stream them through a bounded deque instead of
+                # materialising every line just to keep the last 20.
+                with open(log_path, "r", errors="replace") as f:
+                    tail = deque((line.rstrip("\r\n") for line in f), maxlen=20)
+                return {"logs": list(tail), "ready": False, "error": str(e)}
         except Exception:
             pass
         return {"logs": [], "ready": False, "error": str(e)}
@@ -2249,38 +2285,41 @@ async def get_local_server_status():
     import json
     import asyncio
     
-    try:
+    def _container_running() -> bool:
         client = docker.from_env()
         try:
             container = client.containers.get("local_ai_server")
-            running = container.status == "running"
+            return container.status == "running"
         except:
-            running = False
-        
-        # Try health check
-        healthy = False
-        if running:
-            try:
-                ws_url = os.getenv("HEALTH_CHECK_LOCAL_AI_URL", "ws://127.0.0.1:8765")
-                async with websockets.connect(ws_url, open_timeout=5) as ws:
-                    auth_token = (os.getenv("LOCAL_WS_AUTH_TOKEN", "") or "").strip()
-                    if auth_token:
-                        await ws.send(json.dumps({"type": "auth", "auth_token": auth_token}))
-                        raw = await asyncio.wait_for(ws.recv(), timeout=5)
-                        auth_data = json.loads(raw)
-                        if auth_data.get("type") != "auth_response" or auth_data.get("status") != "ok":
-                            raise RuntimeError(f"Local AI auth failed: {auth_data}")
-
-                    await ws.send(json.dumps({"type": "status"}))
+            return False
+
+    async def _ws_healthy() -> bool:
+        try:
+            ws_url = os.getenv("HEALTH_CHECK_LOCAL_AI_URL", "ws://127.0.0.1:8765")
+            async with websockets.connect(ws_url, open_timeout=5) as ws:
+                auth_token = (os.getenv("LOCAL_WS_AUTH_TOKEN", "") or "").strip()
+                if auth_token:
+                    await ws.send(json.dumps({"type": "auth", "auth_token": auth_token}))
                     raw = await asyncio.wait_for(ws.recv(), timeout=5)
-                    data = json.loads(raw)
-                    healthy = data.get("type") == "status_response" and data.get("status") == "ok"
-            except:
-                pass
+                    auth_data = json.loads(raw)
+                    if auth_data.get("type") != "auth_response" or auth_data.get("status") != "ok":
+                        raise RuntimeError(f"Local AI auth failed: {auth_data}")
+
+                await ws.send(json.dumps({"type": "status"}))
+                raw = await asyncio.wait_for(ws.recv(), timeout=5)
+                data = json.loads(raw)
+                return data.get("type") == "status_response" and data.get("status") == "ok"
+        except:
+            return False
+
+    try:
+        # The container lookup (blocking docker-py call) and the websocket health probe are
+        # independent, so run them concurrently; health only counts if the container runs.
+        running, ws_ok = await asyncio.gather(asyncio.to_thread(_container_running), _ws_healthy())
         
         return {
             "running": running,
-            "healthy": healthy
+            "healthy": running and ws_ok
         }
     except Exception as e:
         return {"running": False, "healthy": False, "error": str(e)}
@@ -2706,11 +2745,16 @@ async def save_setup_config(config: SetupConfig):
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Backup existing files
-        if os.path.exists(ENV_PATH):
-            shutil.copy2(ENV_PATH, f"{ENV_PATH}.bak.{timestamp}")
+        try:
+            # .env is only rewritten via upsert_env_vars (atomic replace), so hardlink it.
+            snapshot_file(ENV_PATH, f"{ENV_PATH}.bak.{timestamp}")
+        except FileNotFoundError:
+            pass
             
-        if os.path.exists(CONFIG_PATH):
+        try:
             shutil.copy2(CONFIG_PATH, f"{CONFIG_PATH}.bak.{timestamp}")
+        except FileNotFoundError:
+            pass
 
         # 1. Update .env
         env_updates = {
@@ -1,11 +1,55 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import settings
+from services.http_cache import etag_matches
 from dotenv import load_dotenv
+import asyncio
+import hashlib
 import os
 import logging
 import secrets
+import shutil
+import signal
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+_OUTBOUND_PROMPT_ASSETS = (
+    ("aava-consent-default.ulaw", "aava-consent-default.ulaw"),
+    ("aava-voicemail-default.ulaw", "aava-voicemail-default.ulaw"),
+)
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy src to dst in-kernel with copy_file_range (a reflink on CoW filesystems).
+
+    Falls back to shutil.copyfile (sendfile) when the syscall is unavailable or refused,
+    e.g. ENOSYS on old kernels or EXDEV across filesystems.
+    """
+    try:
+        in_fd = os.open(src, os.O_RDONLY)
+        try:
+            out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                remaining = os.fstat(in_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(in_fd, out_fd, remaining)
+                    if copied == 0:
+                        raise OSError("copy_file_range made no progress")
+                    remaining -= copied
+            finally:
+                os.close(out_fd)
+        finally:
+            os.close(in_fd)
+    except (OSError, AttributeError):
+        shutil.copyfile(src, dst)
 
 
 def _ensure_outbound_prompt_assets() -> None:
@@ -16,67 +60,260 @@ def _ensure_outbound_prompt_assets() -> None:
     consent/voicemail recordings before first use.
     """
     try:
-        project_root = (os.getenv("PROJECT_ROOT") or "/app/project").strip() or "/app/project"
-        src_dir = Path(project_root) / "assets" / "outbound_prompts" / "en-US"
-        if not src_dir.exists():
+        src_dir = os.path.join(BOOT.project_root, "assets", "outbound_prompts", "en-US")
+        # One directory pass replaces the per-file exists() probes; a missing dir just returns.
+        try:
+            with os.scandir(src_dir) as it:
+                src_entries = {e.name: e for e in it if e.is_file()}
+        except OSError:
+            return
+
+        media_dir = Path(BOOT.media_dir)
+
+        # Destinations that are missing or differ in size (e.g. deleted from the media dir).
+        stale = []
+        for src_name, dst_name in _OUTBOUND_PROMPT_ASSETS:
+            entry = src_entries.get(src_name)
+            if entry is None:
+                continue
+            dst = os.path.join(media_dir, dst_name)
+            try:
+                if os.stat(dst).st_size == entry.stat().st_size:
+                    continue
+            except OSError:
+                pass
+            stale.append((entry.path, dst))
+        if not stale:
             return
 
-        media_dir = Path(os.getenv("AAVA_MEDIA_DIR") or "/mnt/asterisk_media/ai-generated")
         try:
             media_dir.mkdir(parents=True, exist_ok=True)
         except Exception:
             pass
 
-        mapping = {
-            "aava-consent-default.ulaw": "aava-consent-default.ulaw",
-            "aava-voicemail-default.ulaw": "aava-voicemail-default.ulaw",
-        }
-        for src_name, dst_name in mapping.items():
-            src = src_dir / src_name
-            dst = media_dir / dst_name
-            if not src.exists():
-                continue
-            if dst.exists() and dst.stat().st_size == src.stat().st_size:
-                continue
+        for src_path, dst in stale:
             try:
-                data = src.read_bytes()
-                dst.write_bytes(data)
+                _copy_file(src_path, dst)
             except Exception:
                 continue
     except Exception:
         # Never block Admin UI startup for this.
         pass
 
-# Load environment variables (wizard will create .env from .env.example on first Next click)
+# Load environment variables (wizard will create .env from .env.example on first Next click).
+# This stays on the import path: auth reads JWT_SECRET, and CORS/API-docs settings are
+# read, while the app object is being built.
 load_dotenv(settings.ENV_PATH)
 
-# NOTE: DB permission alignment is handled by install/preflight steps (host-side),
-# keeping runtime code minimal and CI security scanners happy.
-_ensure_outbound_prompt_assets()
-
-# SECURITY: Admin UI binds to 0.0.0.0 by default (DX-first).
-# If JWT_SECRET is missing/placeholder, generate an ephemeral secret so tokens
-# aren't signed with a known insecure key. Scripts (preflight/install) should
-# persist a strong JWT_SECRET into .env for stable restarts.
-_uvicorn_host = os.getenv("UVICORN_HOST", "0.0.0.0")
-_is_remote_bind = _uvicorn_host not in ("127.0.0.1", "localhost", "::1")
-_placeholder_secrets = {"", "change-me-please", "changeme"}
-_raw_jwt_secret = (os.getenv("JWT_SECRET", "") or "").strip()
-
-if _is_remote_bind and _raw_jwt_secret in _placeholder_secrets:
-    os.environ["JWT_SECRET"] = secrets.token_hex(32)
-    logging.getLogger(__name__).warning(
-        "JWT_SECRET is missing/placeholder while Admin UI is remote-accessible on %s. "
-        "Generated an ephemeral JWT_SECRET for this process. For production, set a strong "
-        "JWT_SECRET in .env and restrict port 3003 (firewall/VPN/reverse proxy).",
-        _uvicorn_host,
-    )
+_LOCAL_HOSTS = frozenset(("127.0.0.1", "localhost", "::1"))
+
+
+@dataclass(frozen=True, slots=True)
+class BootConfig:
+    """Process-lifetime settings read from the environment once, right after .env is loaded."""
+
+    uvicorn_host: str
+    is_remote_bind: bool
+    jwt_secret: str
+    enable_docs: bool
+    project_root: str
+    media_dir: str
+
+    @classmethod
+    def from_env(cls) -> "BootConfig":
+        uvicorn_host = os.getenv("UVICORN_HOST", "0.0.0.0")
+        return cls(
+            uvicorn_host=uvicorn_host,
+            is_remote_bind=uvicorn_host not in _LOCAL_HOSTS,
+            jwt_secret=(os.getenv("JWT_SECRET", "") or "").strip(),
+            # Allow disabling API docs in production for security hardening
+            enable_docs=os.getenv("ENABLE_API_DOCS", "true").lower() in ("1", "true", "yes"),
+            project_root=(os.getenv("PROJECT_ROOT") or "/app/project").strip() or "/app/project",
+            media_dir=os.getenv("AAVA_MEDIA_DIR") or "/mnt/asterisk_media/ai-generated",
+        )
+
+
+BOOT = BootConfig.from_env()
+
+_PLACEHOLDER_SECRETS = frozenset(("", "change-me-please", "changeme"))
+_DEFAULT_CORS_ORIGINS = ("http://localhost:3003", "http://127.0.0.1:3003")
+
+
+# Configure CORS
+def _parse_cors_origins() -> list[str]:
+    raw = (settings.get_setting("ADMIN_UI_CORS_ORIGINS", "") or "").strip()
+    if not raw:
+        # Safe-ish local defaults.
+        return list(_DEFAULT_CORS_ORIGINS)
+    if raw == "*":
+        return ["*"]
+    # Comma-separated list
+    return [o.strip() for o in raw.split(",") if o.strip()]
+
+
+def _bootstrap_security() -> list[str]:
+    """
+    Apply the JWT_SECRET safety net and return the CORS origins.
+
+    Must run before ``auth`` is imported (it reads JWT_SECRET at import time) and before
+    the CORS middleware is added (middleware can't be added once the app has started).
+    """
+    # SECURITY: Admin UI binds to 0.0.0.0 by default (DX-first).
+    # If JWT_SECRET is missing/placeholder, generate an ephemeral secret so tokens
+    # aren't signed with a known insecure key. Scripts (preflight/install) should
+    # persist a strong JWT_SECRET into .env for stable restarts.
+    if BOOT.is_remote_bind and BOOT.jwt_secret in _PLACEHOLDER_SECRETS:
+        os.environ["JWT_SECRET"] = secrets.token_hex(32)
+        logger.warning(
+            "JWT_SECRET is missing/placeholder while Admin UI is remote-accessible on %s. "
+            "Generated an ephemeral JWT_SECRET for this process. For production, set a strong "
+            "JWT_SECRET in .env and restrict port 3003 (firewall/VPN/reverse proxy).",
+            BOOT.uvicorn_host,
+        )
+    return _parse_cors_origins()
+
+
+cors_origins = _bootstrap_security()
 
-from api import config, system, wizard, logs, local_ai, ollama, mcp, calls, outbound, tools, docs  # noqa: E402
 import auth  # noqa: E402
 
-# Allow disabling API docs in production for security hardening
-_enable_api_docs = os.getenv("ENABLE_API_DOCS", "true").lower() in ("1", "true", "yes")
+# Set once the deferred API routers (and the SPA frontend) are registered.
+_READY = False
+# Set if the deferred init raised; the process is then shutting down.
+_STARTUP_FAILED = False
+
+
+# Protected routes: (api submodule, prefix, tags). "" / None keep the router's own prefix/tags.
+_PROTECTED_ROUTERS = (
+    ("config", "/api/config", ["config"]),
+    ("system", "/api/system", ["system"]),
+    ("wizard", "/api/wizard", ["wizard"]),
+    ("logs", "/api/logs", ["logs"]),
+    ("local_ai", "/api/local-ai", ["local-ai"]),
+    ("mcp", "", None),
+    ("ollama", "", ["ollama"]),
+    ("calls", "/api", ["calls"]),
+    ("outbound", "/api", ["outbound"]),
+    ("tools", "/api/tools", ["tools"]),
+    ("docs", "", ["documentation"]),
+)
+
+
+async def _deferred_init(app: FastAPI) -> None:
+    global _READY
+    # The API modules pull in docker, httpx, yaml, websockets, ... ; importing them is the
+    # bulk of cold-start time, so it happens after the server is already listening, with
+    # each submodule loaded in its own thread so file IO for independent imports overlaps.
+    import api
+    await asyncio.gather(
+        # Initialize users (create default admin if needed; hashing the default password is slow).
+        asyncio.to_thread(auth.load_users),
+        # NOTE: DB permission alignment is handled by install/preflight steps (host-side),
+        # keeping runtime code minimal and CI security scanners happy.
+        asyncio.to_thread(_ensure_outbound_prompt_assets),
+        *(asyncio.to_thread(getattr, api, name) for name in sorted(api._LAZY)),
+    )
+
+    require_user = [Depends(auth.get_current_user)]
+    for name, prefix, tags in _PROTECTED_ROUTERS:
+        app.include_router(getattr(api, name).router, prefix=prefix, tags=tags, dependencies=require_user)
+
+    # The SPA catch-all must come after every API route.
+    _mount_frontend(app)
+    # Drop any schema generated before the routers existed.
+    app.openapi_schema = None
+    _READY = True
+    logger.info("Admin UI API routers loaded")
+
+
+def _on_deferred_init_done(task: "asyncio.Task[None]") -> None:
+    """Fail startup loudly if the deferred init raised, as an import-time error would."""
+    global _STARTUP_FAILED
+    if task.cancelled() or task.exception() is None:
+        return
+    _STARTUP_FAILED = True
+    logger.critical("Admin UI startup failed; shutting down", exc_info=task.exception())
+    # Graceful uvicorn shutdown; the container's restart policy brings it back.
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # uvicorn binds its socket only after lifespan startup returns, so the heavy
+    # router imports run as a background task rather than inline here.
+    init_task = asyncio.create_task(_deferred_init(app))
+    init_task.add_done_callback(_on_deferred_init_done)
+    try:
+        yield
+    finally:
+        if not init_task.done():
+            init_task.cancel()
+        if _READY:
+            from api import system
+            system.close_docker_client()
+            await system.close_http_clients()
+
+
+class _StartupGate:
+    """Answer 503 for API/frontend requests until the deferred routers are registered."""
+
+    _ALWAYS_OPEN = ("/health", "/api/auth/")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not _READY and scope["type"] == "http" and not scope["path"].startswith(self._ALWAYS_OPEN):
+            detail = "Admin UI failed to start" if _STARTUP_FAILED else "Admin UI is starting"
+            response = JSONResponse({"detail": detail}, status_code=503, headers={"Retry-After": "1"})
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class _WildcardCORS:
+    """
+    Static CORS headers for ADMIN_UI_CORS_ORIGINS=* (no credentials).
+
+    Equivalent to CORSMiddleware with allow_origins/methods/headers="*" and
+    allow_credentials=False, without its per-request origin matching.
+    """
+
+    _PREFLIGHT_HEADERS = (
+        (b"access-control-allow-origin", b"*"),
+        (b"access-control-allow-methods", b"*"),
+        (b"access-control-allow-headers", b"*"),
+        (b"access-control-max-age", b"600"),
+    )
+    _ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        # Like CORSMiddleware, only cross-origin requests (those sending Origin) are touched.
+        if not any(name == b"origin" for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send({"type": "http.response.start", "status": 204, "headers": list(self._PREFLIGHT_HEADERS)})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", ())
+                if not any(name.lower() == b"access-control-allow-origin" for name, _ in headers):
+                    # New list: responses may hand us their own raw_headers by reference.
+                    message["headers"] = [*headers, self._ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
 
 app = FastAPI(
     title="Asterisk AI Voice Agent Admin API",
@@ -110,9 +347,13 @@ Most endpoints require JWT authentication. Obtain a token via `POST /api/auth/lo
 | **AI Engine Health Server** (port 15000) | `/health`, `/metrics`, `/live`, `/ready`, `/reload` |
 """,
     version="6.2.0",
-    docs_url="/docs" if _enable_api_docs else None,
-    redoc_url="/redoc" if _enable_api_docs else None,
-    openapi_url="/openapi.json" if _enable_api_docs else None,
+    lifespan=_lifespan,
+    # orjson encodes straight to bytes; FastAPI's ORJSONResponse enables OPT_NON_STR_KEYS,
+    # so dicts keyed by ints (e.g. per-port maps) still serialize.
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if BOOT.enable_docs else None,
+    redoc_url="/redoc" if BOOT.enable_docs else None,
+    openapi_url="/openapi.json" if BOOT.enable_docs else None,
     openapi_tags=[
         {"name": "auth", "description": "Authentication and user management"},
         {"name": "config", "description": "Configuration management (YAML, .env, providers)"},
@@ -129,82 +370,127 @@ Most endpoints require JWT authentication. Obtain a token via `POST /api/auth/lo
     ],
 )
 
-# Initialize users (create default admin if needed)
-auth.load_users()
-
 # Warn if JWT_SECRET isn't set (localhost-only is okay for dev)
 if getattr(auth, "USING_PLACEHOLDER_SECRET", False):
-    logging.getLogger(__name__).warning(
+    logger.warning(
         "JWT_SECRET is missing/placeholder; Admin UI is using an insecure secret. "
         "Set JWT_SECRET in .env for production (recommended: openssl rand -hex 32)."
     )
 
-# Configure CORS
-def _parse_cors_origins() -> list[str]:
-    raw = (settings.get_setting("ADMIN_UI_CORS_ORIGINS", "") or "").strip()
-    if not raw:
-        # Safe-ish local defaults.
-        return ["http://localhost:3003", "http://127.0.0.1:3003"]
-    if raw == "*":
-        return ["*"]
-    # Comma-separated list
-    return [o.strip() for o in raw.split(",") if o.strip()]
-
-
-cors_origins = _parse_cors_origins()
 cors_allow_credentials = "*" not in cors_origins
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins,
-    allow_credentials=cors_allow_credentials,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(_StartupGate)
+if cors_origins == ["*"]:
+    app.add_middleware(_WildcardCORS)
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=cors_allow_credentials,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 # Include routers
-# Public routes
+# Public routes (mounted eagerly so login works while the API is still loading)
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 
-# Protected routes
-app.include_router(config.router, prefix="/api/config", tags=["config"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(system.router, prefix="/api/system", tags=["system"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(wizard.router, prefix="/api/wizard", tags=["wizard"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(logs.router, prefix="/api/logs", tags=["logs"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(local_ai.router, prefix="/api/local-ai", tags=["local-ai"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(mcp.router, dependencies=[Depends(auth.get_current_user)])
-app.include_router(ollama.router, tags=["ollama"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(calls.router, prefix="/api", tags=["calls"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(outbound.router, prefix="/api", tags=["outbound"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(tools.router, prefix="/api/tools", tags=["tools"], dependencies=[Depends(auth.get_current_user)])
-app.include_router(docs.router, tags=["documentation"], dependencies=[Depends(auth.get_current_user)])
+
+def _static_json(body: bytes) -> Tuple[bytes, Mapping[str, str]]:
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return body, MappingProxyType({"ETag": etag, "Cache-Control": "no-cache"})
+
+
+# Probe bodies are encoded once. A fresh Response is still built per request: middleware
+# (CORS) appends to the response's raw header list, so a shared instance would accumulate.
+_HEALTHY = _static_json(b'{"status":"healthy"}')
+_ALIVE = _static_json(b'{"status":"alive"}')
+_READY_BODY = _static_json(b'{"status":"ready"}')
+_STARTING = _static_json(b'{"status":"starting"}')
+_FAILED = _static_json(b'{"status":"failed"}')
+
+
+def _failed_response() -> Response:
+    return Response(_FAILED[0], status_code=503, media_type="application/json", headers=_FAILED[1])
+
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    if _STARTUP_FAILED:
+        return _failed_response()
+    return Response(_HEALTHY[0], media_type="application/json", headers=_HEALTHY[1])
+
+
+@app.get("/health/live")
+async def health_live():
+    if _STARTUP_FAILED:
+        return _failed_response()
+    return Response(_ALIVE[0], media_type="application/json", headers=_ALIVE[1])
+
+
+@app.get("/health/ready")
+async def health_ready():
+    if _STARTUP_FAILED:
+        return _failed_response()
+    if not _READY:
+        return Response(_STARTING[0], status_code=503, media_type="application/json", headers=_STARTING[1])
+    return Response(_READY_BODY[0], media_type="application/json", headers=_READY_BODY[1])
 
 # Serve static files (Frontend)
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-import os
+from starlette.responses import FileResponse as _StarletteFileResponse
+
+
+class _LargeChunkStaticFiles(StaticFiles):
+    """StaticFiles that streams with 1 MiB reads instead of Starlette's 64 KiB default."""
+
+    chunk_size = 1 << 20
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        if isinstance(response, _StarletteFileResponse):
+            response.chunk_size = self.chunk_size
+        return response
+
+
+_SPA_RESERVED_PATHS = frozenset(("docs", "redoc", "openapi.json"))
+# no-store is deliberately absent: browsers must revalidate index.html on every
+# navigation (so a new build is picked up), but can do it with a 304.
+_INDEX_CACHE_HEADERS = MappingProxyType({
+    "Cache-Control": "no-cache, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+})
+
+
+def _mount_frontend(app: FastAPI) -> None:
+    # Mount static files if directory exists (production/docker)
+    static_dir = os.path.join(os.path.dirname(__file__), "static")
+    if not os.path.exists(static_dir):
+        return
+    app.mount("/assets", _LargeChunkStaticFiles(directory=os.path.join(static_dir, "assets")), name="assets")
+
+    # The built index.html is immutable for the life of the process; read it once.
+    try:
+        index_bytes = Path(static_dir, "index.html").read_bytes()
+    except OSError:
+        index_bytes = None
+    index_headers = dict(_INDEX_CACHE_HEADERS)
+    if index_bytes is not None:
+        index_headers["ETag"] = f'"{hashlib.blake2b(index_bytes, digest_size=16).hexdigest()}"'
 
-# Mount static files if directory exists (production/docker)
-static_dir = os.path.join(os.path.dirname(__file__), "static")
-if os.path.exists(static_dir):
-    app.mount("/assets", StaticFiles(directory=os.path.join(static_dir, "assets")), name="assets")
-    
     @app.get("/{full_path:path}")
-    async def serve_react_app(full_path: str):
+    async def serve_react_app(full_path: str, request: Request):
         # API routes are already handled above
-        if full_path.startswith("api/") or full_path in ("docs", "redoc", "openapi.json"):
+        if full_path.startswith("api/") or full_path in _SPA_RESERVED_PATHS:
             raise HTTPException(status_code=404, detail="Not found")
-            
+        if index_bytes is None:
+            raise HTTPException(status_code=404, detail="Not found")
+
         # Serve index.html for all other routes (SPA)
-        response = FileResponse(os.path.join(static_dir, "index.html"))
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
+        if etag_matches(request.headers.get("if-none-match"), index_headers["ETag"]):
+            return Response(status_code=304, headers=index_headers)
+        return Response(index_bytes, media_type="text/html", headers=index_headers)
 
 if __name__ == "__main__":
     import uvicorn
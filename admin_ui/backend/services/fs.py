@@ -2,19 +2,24 @@ from __future__ import annotations
 
 import os
 import re
+import shutil
 import tempfile
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
 
 def atomic_write_text(path: str, content: str, *, mode_from_existing: bool = True) -> None:
+    atomic_write_bytes(path, content.encode("utf-8"), mode_from_existing=mode_from_existing)
+
+
+def atomic_write_bytes(path: str, data: bytes, *, mode_from_existing: bool = True) -> None:
     dir_path = os.path.dirname(path) or "."
     original_mode: Optional[int] = None
     if mode_from_existing and os.path.exists(path):
         original_mode = os.stat(path).st_mode
 
-    with tempfile.NamedTemporaryFile("w", dir=dir_path, delete=False, suffix=".tmp") as f:
-        f.write(content)
+    with tempfile.NamedTemporaryFile("wb", dir=dir_path, delete=False, suffix=".tmp") as f:
+        f.write(data)
         temp_path = f.name
 
     if original_mode is not None:
@@ -31,6 +36,24 @@ def atomic_write_lines(path: str, lines: Iterable[str], *, mode_from_existing: b
     atomic_write_text(path, content, mode_from_existing=mode_from_existing)
 
 
+def snapshot_file(src: str, dst: str) -> None:
+    """
+    Snapshot src to dst, as a hardlink when possible.
+
+    A hardlink is an O(1) metadata operation, but it only stays a snapshot if src is
+    later replaced (atomic_write_* / upsert_env_vars) rather than rewritten in place.
+    Falls back to a full copy when linking is unsupported (cross-device, FS limits).
+    Raises FileNotFoundError if src does not exist, so callers can skip a separate
+    existence check.
+    """
+    try:
+        os.link(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 _ENV_KV_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)\s*$")
 
 
@@ -53,7 +76,7 @@ def upsert_env_vars(
     - Only rewrites lines that are simple KEY=VALUE assignments.
     - Preserves comments and unknown lines verbatim.
     - Ensures the file ends with a newline.
-    - Uses an atomic replace.
+    - Uses an atomic replace, skipped entirely when every key already has the requested value.
     """
     if not updates:
         return EnvUpdateResult(updated_keys=[], added_keys=[])
@@ -85,7 +108,10 @@ def upsert_env_vars(
             continue
         line_content = f"{key}={value}\n"
         if key in key_to_line_idx:
-            new_lines[key_to_line_idx[key]] = line_content
+            idx = key_to_line_idx[key]
+            if new_lines[idx] == line_content:
+                continue
+            new_lines[idx] = line_content
             updated.append(key)
         else:
             added.append(key)
@@ -97,6 +123,9 @@ def upsert_env_vars(
         for key in added:
             new_lines.append(f"{key}={updates[key]}\n")
 
+    if not updated and not added:
+        return EnvUpdateResult(updated_keys=[], added_keys=[])
+
     atomic_write_lines(env_path, new_lines, mode_from_existing=True)
     return EnvUpdateResult(updated_keys=sorted(set(updated)), added_keys=sorted(set(added)))
 
@@ -1,6 +1,9 @@
 import os
+import re
 import shutil
+import threading
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 # Determine if running in Docker or Local
 if os.path.exists("/app/project"):
@@ -30,6 +33,70 @@ def ensure_env_file():
     return False
 
 
+# One KEY=VALUE assignment per line. Keys follow python-dotenv (dots and dashes allowed).
+# Values may be "double quoted" (backslash escapes), 'single quoted' (literal) or bare;
+# a bare value ends at whitespace followed by '#'.
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_.-]*)[ \t]*=[ \t]*"""
+    r"""(?:"((?:[^"\\\n]|\\.)*)"|'([^'\n]*)'|(.*?))"""
+    r"""[ \t\r]*(?:[ \t]#.*)?$""",
+    re.MULTILINE,
+)
+# The escapes python-dotenv decodes inside double quotes.
+_ENV_ESCAPE_RE = re.compile(r"""\\([\\'"abfnrtv])""")
+_ENV_ESCAPES = {
+    "\\": "\\", "'": "'", '"': '"',
+    "a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v",
+}
+
+# (path, (inode, mtime_ns, size), parsed values) of the last .env parse.
+_env_cache: Optional[Tuple[str, Tuple[int, int, int], Dict[str, str]]] = None
+_env_cache_lock = threading.Lock()
+
+
+def invalidate_env_cache() -> None:
+    """Drop the cached .env parse (call after writing the file)."""
+    global _env_cache
+    with _env_cache_lock:
+        _env_cache = None
+
+
+def _read_env_file(env_path: str = ENV_PATH) -> Dict[str, str]:
+    """Parse a .env file into a dict, cached until the file changes.
+
+    The cache is keyed on inode, mtime and size so atomic replaces (new inode)
+    and in-place edits are both picked up. The returned dict is shared; do not
+    mutate it.
+    """
+    global _env_cache
+    try:
+        st = os.stat(env_path)
+    except OSError:
+        return {}
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    with _env_cache_lock:
+        cached = _env_cache
+    if cached is not None and cached[0] == env_path and cached[1] == stamp:
+        return cached[2]
+
+    with open(env_path, 'r') as f:
+        data = f.read()
+
+    values: Dict[str, str] = {}
+    for m in _ENV_LINE_RE.finditer(data):
+        key, dquoted, squoted, bare = m.groups()
+        if dquoted is not None:
+            values[key] = _ENV_ESCAPE_RE.sub(lambda e: _ENV_ESCAPES[e.group(1)], dquoted)
+        elif squoted is not None:
+            values[key] = squoted
+        else:
+            values[key] = bare
+
+    with _env_cache_lock:
+        _env_cache = (env_path, stamp, values)
+    return values
+
+
 def get_setting(key: str, default: str = "") -> str:
     """Get a setting from .env file or environment variable.
     
@@ -46,13 +113,8 @@ def get_setting(key: str, default: str = "") -> str:
         return value
     
     # Then check .env file
-    if os.path.exists(ENV_PATH):
-        with open(ENV_PATH, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    k, v = line.split('=', 1)
-                    if k.strip() == key:
-                        return v.strip()
+    value = _read_env_file().get(key)
+    if value is not None:
+        return value
     
     return default
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from services.fs import upsert_env_vars  # noqa: E402
+
+
+def test_upsert_env_vars_updates_in_place_and_preserves_comments(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("# keep me\nA=1\nB=2\n", encoding="utf-8")
+
+    result = upsert_env_vars(str(env_path), {"A": "9", "C": "3"}, header="Added")
+
+    assert result.updated_keys == ["A"]
+    assert result.added_keys == ["C"]
+    assert env_path.read_text(encoding="utf-8") == "# keep me\nA=9\nB=2\n\n# Added\nC=3\n"
+
+
+def test_upsert_env_vars_skips_write_when_values_unchanged(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("A=1\nB=2\n", encoding="utf-8")
+    inode_before = env_path.stat().st_ino
+
+    result = upsert_env_vars(str(env_path), {"A": "1", "B": "2"})
+
+    assert result.updated_keys == []
+    assert result.added_keys == []
+    assert env_path.stat().st_ino == inode_before
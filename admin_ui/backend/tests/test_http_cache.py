@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from services.http_cache import etag_matches  # noqa: E402
+
+ETAG = '"abc123"'
+
+
+def test_etag_matches_missing_header() -> None:
+    assert etag_matches(None, ETAG) is False
+    assert etag_matches("", ETAG) is False
+
+
+def test_etag_matches_exact_and_weak_tags() -> None:
+    assert etag_matches('"abc123"', ETAG) is True
+    assert etag_matches('W/"abc123"', ETAG) is True
+    assert etag_matches('"other", W/"abc123"', ETAG) is True
+
+
+def test_etag_matches_wildcard_and_mismatch() -> None:
+    assert etag_matches("*", ETAG) is True
+    assert etag_matches('"other"', ETAG) is False
+    # The quotes are part of the tag.
+    assert etag_matches("abc123", ETAG) is False
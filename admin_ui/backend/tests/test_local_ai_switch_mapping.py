@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(BACKEND_ROOT))
 
@@ -11,37 +13,41 @@ from api.local_ai import (  # noqa: E402
 )
 
 
-def test_ws_payload_faster_whisper_uses_stt_config_model() -> None:
-    req = SwitchModelRequest(model_type="stt", backend="faster_whisper", model_path="base")
-    assert _build_local_ai_ws_switch_payload(req) == {
-        "type": "switch_model",
-        "stt_backend": "faster_whisper",
-        "stt_config": {"model": "base"},
-    }
-
-
-def test_env_and_yaml_updates_faster_whisper_persists_model_id() -> None:
-    req = SwitchModelRequest(model_type="stt", backend="faster_whisper", model_path="base")
-    env_updates, yaml_updates = _build_local_ai_env_and_yaml_updates(req)
-    assert env_updates["LOCAL_STT_BACKEND"] == "faster_whisper"
-    assert env_updates["FASTER_WHISPER_MODEL"] == "base"
-    assert yaml_updates["stt_backend"] == "faster_whisper"
-    assert yaml_updates["stt_model"] == "base"
-
-
-def test_ws_payload_melotts_uses_tts_config_voice() -> None:
-    req = SwitchModelRequest(model_type="tts", backend="melotts", model_path="EN-US")
-    assert _build_local_ai_ws_switch_payload(req) == {
-        "type": "switch_model",
-        "tts_backend": "melotts",
-        "tts_config": {"voice": "EN-US"},
-    }
+# (model_type, backend, model_path, expected ws payload, expected env subset, expected yaml subset)
+CASES = [
+    (
+        "stt",
+        "faster_whisper",
+        "base",
+        {"type": "switch_model", "stt_backend": "faster_whisper", "stt_config": {"model": "base"}},
+        {"LOCAL_STT_BACKEND": "faster_whisper", "FASTER_WHISPER_MODEL": "base"},
+        {"stt_backend": "faster_whisper", "stt_model": "base"},
+    ),
+    (
+        "tts",
+        "melotts",
+        "EN-US",
+        {"type": "switch_model", "tts_backend": "melotts", "tts_config": {"voice": "EN-US"}},
+        {"LOCAL_TTS_BACKEND": "melotts", "MELOTTS_VOICE": "EN-US"},
+        {"tts_backend": "melotts", "tts_voice": "EN-US"},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "model_type,backend,model_path,ws,env,yaml",
+    CASES,
+    ids=[case[1] for case in CASES],
+)
+def test_switch_request_maps_to_ws_payload_and_persisted_updates(
+    model_type, backend, model_path, ws, env, yaml
+) -> None:
+    req = SwitchModelRequest(model_type=model_type, backend=backend, model_path=model_path)
 
+    assert _build_local_ai_ws_switch_payload(req) == ws
 
-def test_env_and_yaml_updates_melotts_persists_voice_id() -> None:
-    req = SwitchModelRequest(model_type="tts", backend="melotts", model_path="EN-US")
     env_updates, yaml_updates = _build_local_ai_env_and_yaml_updates(req)
-    assert env_updates["LOCAL_TTS_BACKEND"] == "melotts"
-    assert env_updates["MELOTTS_VOICE"] == "EN-US"
-    assert yaml_updates["tts_backend"] == "melotts"
-    assert yaml_updates["tts_voice"] == "EN-US"
+    for key, value in env.items():
+        assert env_updates[key] == value
+    for key, value in yaml.items():
+        assert yaml_updates[key] == value
@@ -0,0 +1,44 @@
+import dataclasses
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+
+
+def _setup(monkeypatch, tmp_path):
+    src_dir = tmp_path / "project" / "assets" / "outbound_prompts" / "en-US"
+    src_dir.mkdir(parents=True)
+    for src_name, _ in main._OUTBOUND_PROMPT_ASSETS:
+        (src_dir / src_name).write_bytes(b"\xff" * 160)
+    media_dir = tmp_path / "media"
+    boot = dataclasses.replace(main.BOOT, project_root=str(tmp_path / "project"), media_dir=str(media_dir))
+    monkeypatch.setattr(main, "BOOT", boot)
+    return media_dir
+
+
+def test_assets_are_installed_into_the_media_dir(monkeypatch, tmp_path) -> None:
+    media_dir = _setup(monkeypatch, tmp_path)
+    main._ensure_outbound_prompt_assets()
+    for _, dst_name in main._OUTBOUND_PROMPT_ASSETS:
+        assert (media_dir / dst_name).read_bytes() == b"\xff" * 160
+
+
+def test_installed_assets_are_left_alone_and_deleted_ones_restored(monkeypatch, tmp_path) -> None:
+    media_dir = _setup(monkeypatch, tmp_path)
+    main._ensure_outbound_prompt_assets()
+    kept_name = main._OUTBOUND_PROMPT_ASSETS[0][1]
+    deleted_name = main._OUTBOUND_PROMPT_ASSETS[1][1]
+    kept_mtime = (media_dir / kept_name).stat().st_mtime_ns
+    (media_dir / deleted_name).unlink()
+
+    copies = []
+    real_copy = main._copy_file
+    monkeypatch.setattr(main, "_copy_file", lambda src, dst: (copies.append(dst), real_copy(src, dst)))
+    main._ensure_outbound_prompt_assets()
+
+    assert copies == [str(media_dir / deleted_name)]
+    assert (media_dir / deleted_name).exists()
+    assert (media_dir / kept_name).stat().st_mtime_ns == kept_mtime
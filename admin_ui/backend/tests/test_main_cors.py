@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+
+
+def _client() -> TestClient:
+    inner = FastAPI()
+
+    @inner.get("/plain")
+    async def plain():
+        return {"ok": True}
+
+    @inner.get("/own-cors")
+    async def own_cors():
+        return Response(b"{}", headers={"Access-Control-Allow-Origin": "https://example.com"})
+
+    return TestClient(main._WildcardCORS(inner))
+
+
+def test_wildcard_cors_skips_same_origin_requests() -> None:
+    response = _client().get("/plain")
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_wildcard_cors_adds_header_to_cross_origin_requests() -> None:
+    response = _client().get("/plain", headers={"Origin": "https://other.example"})
+    assert response.headers["access-control-allow-origin"] == "*"
+
+
+def test_wildcard_cors_keeps_an_existing_allow_origin() -> None:
+    response = _client().get("/own-cors", headers={"Origin": "https://other.example"})
+    assert response.headers.get_list("access-control-allow-origin") == ["https://example.com"]
+
+
+def test_wildcard_cors_answers_preflight() -> None:
+    response = _client().options(
+        "/plain",
+        headers={"Origin": "https://other.example", "Access-Control-Request-Method": "POST"},
+    )
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-methods"] == "*"
+    assert response.headers["access-control-max-age"] == "600"
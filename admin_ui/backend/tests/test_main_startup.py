@@ -0,0 +1,81 @@
+import asyncio
+import signal
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+
+
+def _finished_task(coro):
+    async def run():
+        task = asyncio.create_task(coro)
+        await asyncio.gather(task, return_exceptions=True)
+        return task
+
+    return asyncio.run(run())
+
+
+def test_startup_gate_holds_api_until_ready(monkeypatch) -> None:
+    monkeypatch.setattr(main, "_READY", False)
+    client = TestClient(main.app)
+
+    response = client.get("/api/system/containers")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json() == {"detail": "Admin UI is starting"}
+
+    assert client.get("/health").status_code == 200
+    assert client.get("/health/ready").json() == {"status": "starting"}
+
+
+def test_startup_gate_passes_requests_once_ready(monkeypatch) -> None:
+    monkeypatch.setattr(main, "_READY", True)
+    client = TestClient(main.app)
+
+    assert client.get("/api/does-not-exist").status_code == 404
+    assert client.get("/health/ready").json() == {"status": "ready"}
+
+
+def test_failed_deferred_init_is_logged_and_stops_the_process(monkeypatch, caplog) -> None:
+    monkeypatch.setattr(main, "_READY", False)
+    monkeypatch.setattr(main, "_STARTUP_FAILED", False)
+    kills = []
+    monkeypatch.setattr(main.os, "kill", lambda pid, sig: kills.append((pid, sig)))
+
+    async def broken_init():
+        raise RuntimeError("router import failed")
+
+    main._on_deferred_init_done(_finished_task(broken_init()))
+
+    assert kills == [(main.os.getpid(), signal.SIGTERM)]
+    assert "Admin UI startup failed" in caplog.text
+    assert "router import failed" in caplog.text
+
+    client = TestClient(main.app)
+    assert client.get("/api/system/containers").json() == {"detail": "Admin UI failed to start"}
+    assert client.get("/health").status_code == 503
+    assert client.get("/health/ready").json() == {"status": "failed"}
+
+
+def test_successful_or_cancelled_init_does_not_stop_the_process(monkeypatch) -> None:
+    monkeypatch.setattr(main, "_STARTUP_FAILED", False)
+    kills = []
+    monkeypatch.setattr(main.os, "kill", lambda pid, sig: kills.append((pid, sig)))
+
+    async def ok_init():
+        return None
+
+    async def cancelled_init():
+        asyncio.current_task().cancel()
+        await asyncio.sleep(0)
+
+    main._on_deferred_init_done(_finished_task(ok_init()))
+    main._on_deferred_init_done(_finished_task(cancelled_init()))
+
+    assert kills == []
+    assert main._STARTUP_FAILED is False
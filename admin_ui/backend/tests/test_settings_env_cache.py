@@ -0,0 +1,100 @@
+import os
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import settings  # noqa: E402
+
+
+def test_read_env_file_parses_and_last_assignment_wins(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("# comment\nA=1\nB = x=y\n\nA=2\n", encoding="utf-8")
+    settings.invalidate_env_cache()
+
+    assert settings._read_env_file(str(env_path)) == {"A": "2", "B": "x=y"}
+
+
+def test_read_env_file_strips_matching_quotes(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("A=\"quoted value\"\nB='single'\nC=\"unbalanced\nD=\"\n", encoding="utf-8")
+    settings.invalidate_env_cache()
+
+    assert settings._read_env_file(str(env_path)) == {
+        "A": "quoted value",
+        "B": "single",
+        "C": "\"unbalanced",
+        "D": "\"",
+    }
+
+
+def test_read_env_file_handles_inline_comments_and_escapes(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "PASS=ab#cd\n"
+        "BARE=value # trailing comment\n"
+        "QUOTED=\"a # b\" # trailing comment\n"
+        "ESCAPED=\"say \\\"hi\\\"\"\n"
+        "export EXPORTED=1\n"
+        "CRLF=x\r\n",
+        encoding="utf-8",
+    )
+    settings.invalidate_env_cache()
+
+    assert settings._read_env_file(str(env_path)) == {
+        "PASS": "ab#cd",
+        "BARE": "value",
+        "QUOTED": "a # b",
+        "ESCAPED": 'say "hi"',
+        "EXPORTED": "1",
+        "CRLF": "x",
+    }
+
+
+def test_read_env_file_reuses_cache_until_file_changes(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("A=1\n", encoding="utf-8")
+    settings.invalidate_env_cache()
+
+    first = settings._read_env_file(str(env_path))
+    assert settings._read_env_file(str(env_path)) is first
+
+    # Atomic replace (new inode), as done by services.fs.upsert_env_vars.
+    tmp = tmp_path / ".env.tmp"
+    tmp.write_text("A=1\nC=3\n", encoding="utf-8")
+    os.replace(tmp, env_path)
+    assert settings._read_env_file(str(env_path)) == {"A": "1", "C": "3"}
+
+
+def test_read_env_file_missing_file_returns_empty(tmp_path) -> None:
+    assert settings._read_env_file(str(tmp_path / "missing.env")) == {}
+
+
+def test_read_env_file_accepts_dotted_and_dashed_keys(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("LOG.LEVEL=debug\nMY-KEY=1\nexport A.B-C=x\n", encoding="utf-8")
+    settings.invalidate_env_cache()
+
+    assert settings._read_env_file(str(env_path)) == {"LOG.LEVEL": "debug", "MY-KEY": "1", "A.B-C": "x"}
+
+
+def test_read_env_file_decodes_dotenv_escapes_in_double_quotes(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "NL=\"a\\nb\"\n"
+        "TAB=\"a\\tb\"\n"
+        "SQ=\"it\\'s\"\n"
+        "UNKNOWN=\"a\\qb\"\n"
+        "LITERAL='a\\nb'\n",
+        encoding="utf-8",
+    )
+    settings.invalidate_env_cache()
+
+    assert settings._read_env_file(str(env_path)) == {
+        "NL": "a\nb",
+        "TAB": "a\tb",
+        "SQ": "it's",
+        "UNKNOWN": "a\\qb",
+        "LITERAL": "a\\nb",
+    }
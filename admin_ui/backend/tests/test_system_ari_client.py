@@ -0,0 +1,33 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from api import system  # noqa: E402
+
+
+def test_shared_ari_client_does_not_carry_cookies_between_hosts(monkeypatch) -> None:
+    monkeypatch.setattr(system, "_ari_http_clients", {})
+    seen_cookies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(200, headers={"Set-Cookie": "session=secret; Path=/"}, json={})
+
+    async def run():
+        client = system._get_ari_http_client(True)
+        client._transport = httpx.MockTransport(handler)
+        try:
+            await client.get("http://pbx-a.example:8088/ari/asterisk/info", auth=("a", "x"))
+            await client.get("http://pbx-a.example:8088/ari/asterisk/info", auth=("a", "x"))
+            await client.get("http://pbx-b.example:8088/ari/asterisk/info", auth=("b", "y"))
+            return len(client.cookies.jar)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == 0
+    assert seen_cookies == [None, None, None]
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from api import system  # noqa: E402
+
+
+class _FakeEvents:
+    """Blocking docker-py style event iterator; ends when closed."""
+
+    def __init__(self, events):
+        self._events = list(events)
+        self._closed = threading.Event()
+        self.closed = False
+
+    def __iter__(self):
+        yield from self._events
+        self._closed.wait(timeout=5)
+
+    def close(self):
+        self.closed = True
+        self._closed.set()
+
+
+def _parse_frames(frames):
+    parsed = []
+    for frame in frames:
+        event = data = None
+        for line in frame.strip().splitlines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        parsed.append((event, data))
+    return parsed
+
+
+async def _collect(stream, count):
+    frames = []
+    async for frame in stream:
+        frames.append(frame)
+        if len(frames) == count:
+            break
+    await stream.aclose()
+    return frames
+
+
+def test_event_stream_sends_fresh_snapshot_then_lifecycle_events(monkeypatch) -> None:
+    listings = []
+
+    async def fake_list():
+        listings.append(1)
+        return [{"id": "abc", "name": "ai_engine", "state": "running"}]
+
+    async def stale_cache(*args, **kwargs):
+        raise AssertionError("snapshot must not come from the response cache")
+
+    monkeypatch.setattr(system, "_list_containers", fake_list)
+    monkeypatch.setattr(system, "_cached_response", stale_cache)
+    system._response_cache["containers"] = (0.0, [])
+    events = _FakeEvents([
+        {"Action": "exec_start: sh", "Actor": {"ID": "abc", "Attributes": {"name": "ai_engine"}}},
+        {"Action": "die", "time": 1, "Actor": {"ID": "abc", "Attributes": {"name": "ai_engine", "image": "img"}}},
+    ])
+
+    frames = asyncio.run(_collect(system._container_event_stream(events), 2))
+
+    assert _parse_frames(frames) == [
+        ("snapshot", [{"id": "abc", "name": "ai_engine", "state": "running"}]),
+        ("container", {"id": "abc", "name": "ai_engine", "image": "img", "action": "die", "time": 1}),
+    ]
+    assert listings == [1]
+    assert events.closed
+    # A lifecycle event drops the cached GET /containers payload.
+    assert "containers" not in system._response_cache
@@ -0,0 +1,66 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from api import system  # noqa: E402
+
+
+@pytest.fixture
+def fake_bin(monkeypatch, tmp_path):
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setattr(system, "_host_tools_result", None)
+    monkeypatch.setattr(system, "_HOST_TOOL_TIMEOUT_S", 1)
+    # No SELinux / FreePBX on the "host": only asterisk is probed.
+    real_exists = os.path.exists
+    monkeypatch.setattr(system.os.path, "exists", lambda path: path != "/sys/fs/selinux" and real_exists(path))
+    monkeypatch.setattr(system, "_freepbx_present", lambda: False)
+
+    def install(name, body):
+        script = tmp_path / name
+        script.write_text(f"#!/bin/sh\n{body}\n", encoding="utf-8")
+        script.chmod(0o755)
+
+    return install
+
+
+def test_host_tool_probe_result_is_cached(fake_bin) -> None:
+    fake_bin("asterisk", "echo 'Asterisk 20.5.0'")
+    assert system._probe_host_tools() == {"asterisk": (0, "Asterisk 20.5.0")}
+
+    fake_bin("asterisk", "echo 'Asterisk 21.0.0'")
+    assert system._probe_host_tools() == {"asterisk": (0, "Asterisk 20.5.0")}
+
+    system._invalidate_platform_cache()
+    assert system._probe_host_tools() == {"asterisk": (0, "Asterisk 21.0.0")}
+
+
+def test_hung_host_tool_times_out_and_is_not_cached(fake_bin) -> None:
+    fake_bin("asterisk", "exec sleep 30")
+    rc, _ = system._probe_host_tools()["asterisk"]
+    assert rc == system._TIMEOUT_EXIT_CODE
+    assert system._host_tools_result is None
+
+    fake_bin("asterisk", "echo 'Asterisk 20.5.0'")
+    assert system._probe_host_tools() == {"asterisk": (0, "Asterisk 20.5.0")}
+
+
+def test_failed_host_tool_probe_is_not_cached(fake_bin, monkeypatch) -> None:
+    def boom(*args, **kwargs):
+        raise OSError("fork failed")
+
+    monkeypatch.setattr(system.subprocess, "run", boom)
+    assert system._probe_host_tools() == {}
+    assert system._host_tools_result is None
+
+
+def test_detect_asterisk_retries_after_a_failed_probe(fake_bin) -> None:
+    fake_bin("asterisk", "exec sleep 30")
+    assert system._detect_asterisk()["version"] is None
+
+    fake_bin("asterisk", "echo 'Asterisk 20.5.0'")
+    assert system._detect_asterisk()["version"] == "Asterisk 20.5.0"
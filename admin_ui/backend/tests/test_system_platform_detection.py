@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from api import system  # noqa: E402
+
+
+def test_detect_compose_retries_after_a_failed_probe_and_caches_success(monkeypatch) -> None:
+    monkeypatch.setattr(system, "_compose_result", None)
+    docker_up = [False]
+    listings = []
+
+    def containers(filters):
+        listings.append(filters)
+        return [{"Labels": {"com.docker.compose.version": "2.24.6"}}]
+
+    def get_client():
+        if not docker_up[0]:
+            raise ConnectionError("docker.sock unavailable")
+        return SimpleNamespace(api=SimpleNamespace(containers=containers))
+
+    def no_cli():
+        raise FileNotFoundError("docker")
+
+    monkeypatch.setattr(system, "_get_docker_client", get_client)
+    monkeypatch.setattr(system, "get_docker_compose_cmd", no_cli)
+
+    first = system._detect_compose()
+    assert first["installed"] is False
+    assert first["message"] == "Docker Compose not detected"
+
+    docker_up[0] = True
+    second = system._detect_compose()
+    assert second["installed"] is True
+    assert second["version"] == "2.24.6"
+    assert second["type"] == "host_label"
+
+    assert system._detect_compose() == second
+    assert len(listings) == 1
@@ -0,0 +1,69 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from api import system  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(monkeypatch):
+    monkeypatch.setattr(system, "_response_cache", {})
+    monkeypatch.setattr(system, "_response_cache_locks", {})
+
+
+def test_cached_response_single_flight_for_concurrent_callers() -> None:
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": len(calls)}
+
+    async def run():
+        return await asyncio.gather(*(system._cached_response("k", compute) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert calls == [1]
+    assert results == [{"value": 1}] * 5
+
+
+def test_cached_response_recomputes_after_ttl(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(system.time, "monotonic", lambda: now[0])
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    async def get():
+        return await system._cached_response("k", compute, ttl_sec=1.0)
+
+    assert asyncio.run(get()) == 1
+    now[0] += 0.5
+    assert asyncio.run(get()) == 1
+    now[0] += 1.0
+    assert asyncio.run(get()) == 2
+
+
+def test_cached_response_does_not_cache_errors() -> None:
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("docker unavailable")
+        return "ok"
+
+    async def get():
+        return await system._cached_response("k", compute)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(get())
+    assert asyncio.run(get()) == "ok"
+    assert len(calls) == 2
@@ -0,0 +1,71 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from api import system  # noqa: E402
+
+
+class _FakeContainer:
+    def __init__(self, config_hash):
+        self.status = "exited"
+        self.labels = {"com.docker.compose.config-hash": config_hash} if config_hash else {}
+        self.started = False
+
+    def start(self):
+        self.started = True
+
+
+@pytest.fixture
+def fake_docker(monkeypatch):
+    def install(container, current_hash):
+        client = SimpleNamespace(containers=SimpleNamespace(get=lambda name: container))
+        monkeypatch.setattr(system, "_get_docker_client", lambda: client)
+        monkeypatch.setattr(system, "_compose_config_hash", lambda service: current_hash)
+        recreated = []
+
+        async def fake_recreate(service, health_check=True):
+            recreated.append(service)
+            return {"status": "success", "method": "docker-compose"}
+
+        monkeypatch.setattr(system, "_recreate_via_compose", fake_recreate)
+        return recreated
+
+    return install
+
+
+def test_start_uses_sdk_when_config_hash_matches(fake_docker) -> None:
+    container = _FakeContainer("abc")
+    recreated = fake_docker(container, "abc")
+
+    result = asyncio.run(system._start_existing_container("ai_engine"))
+
+    assert result["method"] == "docker-sdk"
+    assert container.started
+    assert recreated == []
+
+
+def test_start_recreates_when_config_hash_changed(fake_docker) -> None:
+    container = _FakeContainer("abc")
+    recreated = fake_docker(container, "def")
+
+    result = asyncio.run(system._start_existing_container("ai_engine"))
+
+    assert result["method"] == "docker-compose"
+    assert recreated == ["ai_engine"]
+    assert not container.started
+
+
+@pytest.mark.parametrize("created_hash, current_hash", [(None, "abc"), ("abc", None)])
+def test_start_falls_back_to_compose_up_when_hash_unknown(fake_docker, created_hash, current_hash) -> None:
+    container = _FakeContainer(created_hash)
+    recreated = fake_docker(container, current_hash)
+
+    assert asyncio.run(system._start_existing_container("ai_engine")) is None
+    assert not container.started
+    assert recreated == []
@@ -0,0 +1,102 @@
+import { useEffect, useRef } from 'react';
+import axios from 'axios';
+import { ApiErrorInfo, describeApiError } from '../utils/apiErrors';
+
+const EVENTS_ENDPOINT = '/api/system/containers/events';
+const CONTAINERS_ENDPOINT = '/api/system/containers';
+// A burst of lifecycle events (stop/die/destroy/create/start) collapses into one refresh.
+const REFRESH_DEBOUNCE_MS = 300;
+// The stream ends when the backend restarts; reconnect (and take a fresh snapshot) after this.
+const RECONNECT_DELAY_MS = 5000;
+
+interface ContainerEventHandlers<T> {
+    onContainers: (containers: T[]) => void;
+    onError?: (info: ApiErrorInfo) => void;
+}
+
+/**
+ * Live container list from the backend's SSE stream: a snapshot on connect, then a
+ * debounced GET /api/system/containers after each container lifecycle event.
+ */
+export const useContainerEvents = <T>({ onContainers, onError }: ContainerEventHandlers<T>) => {
+    // Keep the latest callbacks without resubscribing on every render.
+    const handlers = useRef({ onContainers, onError });
+    handlers.current = { onContainers, onError };
+
+    useEffect(() => {
+        const controller = new AbortController();
+        let refreshTimer: ReturnType<typeof setTimeout> | undefined;
+        let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+
+        const scheduleRefresh = () => {
+            clearTimeout(refreshTimer);
+            refreshTimer = setTimeout(async () => {
+                try {
+                    const res = await axios.get(CONTAINERS_ENDPOINT);
+                    handlers.current.onContainers(res.data);
+                } catch (err) {
+                    handlers.current.onError?.(describeApiError(err, CONTAINERS_ENDPOINT));
+                }
+            }, REFRESH_DEBOUNCE_MS);
+        };
+
+        const subscribe = async () => {
+            const auth = axios.defaults.headers.common.Authorization;
+            const res = await fetch(EVENTS_ENDPOINT, {
+                headers: auth ? { Authorization: String(auth) } : {},
+                signal: controller.signal,
+            });
+            if (!res.ok || !res.body) {
+                const body = await res.json().catch(() => null);
+                handlers.current.onError?.({
+                    kind: 'http',
+                    endpoint: EVENTS_ENDPOINT,
+                    status: res.status,
+                    statusText: res.statusText,
+                    message: `Request failed with status ${res.status}`,
+                    detail: typeof body?.detail === 'string' ? body.detail : undefined,
+                });
+                return;
+            }
+            const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = '';
+            for (;;) {
+                const { value, done } = await reader.read();
+                if (done) return;
+                buffer += value;
+                const frames = buffer.split('\n\n');
+                buffer = frames.pop() ?? '';
+                for (const frame of frames) {
+                    const event = /^event: (.*)$/m.exec(frame)?.[1];
+                    const data = /^data: (.*)$/m.exec(frame)?.[1];
+                    if (event === 'snapshot' && data) {
+                        handlers.current.onContainers(JSON.parse(data));
+                    } else if (event === 'container') {
+                        scheduleRefresh();
+                    }
+                }
+            }
+        };
+
+        const connect = () => {
+            subscribe()
+                .catch((err) => {
+                    if (!controller.signal.aborted) {
+                        handlers.current.onError?.(describeApiError(err, EVENTS_ENDPOINT));
+                    }
+                })
+                .finally(() => {
+                    if (!controller.signal.aborted) {
+                        reconnectTimer = setTimeout(connect, RECONNECT_DELAY_MS);
+                    }
+                });
+        };
+        connect();
+
+        return () => {
+            controller.abort();
+            clearTimeout(refreshTimer);
+            clearTimeout(reconnectTimer);
+        };
+    }, []);
+};
@@ -4,15 +4,9 @@ import { useNavigate } from 'react-router-dom';
 import axios from 'axios';
 import { toast } from 'sonner';
 import { SystemTopology } from '../components/SystemTopology';
+import { useContainerEvents } from '../hooks/useContainerEvents';
 import { ApiErrorInfo, buildDockerAccessHints, describeApiError } from '../utils/apiErrors';
 
-interface Container {
-    id: string;
-    name: string;
-    status: string;
-    state: string;
-}
-
 interface SystemMetrics {
     cpu: {
         percent: number;
@@ -78,7 +72,6 @@ const CompactMetric = ({ title, value, subValue, icon: Icon, color }: CompactMet
 );
 
 const Dashboard = () => {
-    const [, setContainers] = useState<Container[]>([]);
     const [metrics, setMetrics] = useState<SystemMetrics | null>(null);
     const [directoryHealth, setDirectoryHealth] = useState<DirectoryHealth | null>(null);
     const [loading, setLoading] = useState(true);
@@ -92,27 +85,27 @@ const Dashboard = () => {
     const [ariConnected, setAriConnected] = useState<boolean | null>(null);
     const navigate = useNavigate();
 
+    // Container state comes from the SSE stream rather than the 5s poll below; only its
+    // errors are shown here.
+    useContainerEvents({
+        onContainers: () => setContainersError(null),
+        onError: (info) => {
+            console.error('Failed to fetch containers:', info);
+            setContainersError(info);
+        },
+    });
+
     const fetchData = async () => {
-        setContainersError(null);
         setMetricsError(null);
 
         const results = await Promise.allSettled([
-            axios.get('/api/system/containers'),
             axios.get('/api/system/metrics'),
             axios.get('/api/system/directories'),
             axios.get('/api/system/platform'),
             axios.get('/api/system/asterisk-status'),
         ]);
 
-        const [containersRes, metricsRes, dirHealthRes, platformRes, asteriskRes] = results;
-
-        if (containersRes.status === 'fulfilled') {
-            setContainers(containersRes.value.data);
-        } else {
-            const info = describeApiError(containersRes.reason, '/api/system/containers');
-            console.error('Failed to fetch containers:', info);
-            setContainersError(info);
-        }
+        const [metricsRes, dirHealthRes, platformRes, asteriskRes] = results;
 
         if (metricsRes.status === 'fulfilled') {
             setMetrics(metricsRes.value.data);
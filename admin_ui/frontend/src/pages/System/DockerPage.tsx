@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useConfirmDialog } from '../../hooks/useConfirmDialog';
+import { useContainerEvents } from '../../hooks/useContainerEvents';
 import { Container, RefreshCw, AlertCircle, Clock, CheckCircle2, XCircle, HardDrive, Trash2, Database, Layers, Box } from 'lucide-react';
 import { ConfigSection } from '../../components/ui/ConfigSection';
 import { ConfigCard } from '../../components/ui/ConfigCard';
@@ -144,6 +145,9 @@ const DockerPage = () => {
         fetchDiskUsage();
     }, []);
 
+    // Live container state instead of polling: snapshot on connect, refresh on lifecycle events.
+    useContainerEvents<ContainerInfo>({ onContainers: setContainers });
+
     const handleRestart = async (id: string, name: string) => {
         setActionLoading(id);
         try {